@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import secrets
 import subprocess
 import time
 from contextlib import nullcontext
@@ -53,6 +55,7 @@ from gerris_erfolgs_tracker.constants import (
     SHOW_SAFETY_NOTES_KEY,
     SHOW_STORAGE_NOTICE_KEY,
     SS_SETTINGS,
+    STORAGE_BACKEND_KEY,
 )
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant, ensure_quadrant
 from gerris_erfolgs_tracker.gamification import (
@@ -114,6 +117,7 @@ from gerris_erfolgs_tracker.models import (
     TodoItem,
 )
 from gerris_erfolgs_tracker.state import (
+    batch_saves,
     configure_storage,
     get_todos,
     init_state,
@@ -125,6 +129,7 @@ from gerris_erfolgs_tracker.state_persistence import PERSISTED_KEYS
 from gerris_erfolgs_tracker.storage import FileStorageBackend
 from gerris_erfolgs_tracker.todos import (
     add_todo,
+    frozen_now,
     toggle_complete,
     update_milestone,
     update_todo,
@@ -413,8 +418,12 @@ def _is_streamlit_cloud() -> bool:
 
 
 def _bootstrap_storage() -> FileStorageBackend:
-    backend = FileStorageBackend()
-    configure_storage(backend)
+    # Reuse the session's backend: it remembers the last saved state, so later
+    # saves only append the changes to the mutation log.
+    backend = st.session_state.get(STORAGE_BACKEND_KEY)
+    if not isinstance(backend, FileStorageBackend):
+        backend = FileStorageBackend()
+        configure_storage(backend)
     if not st.session_state.get("_storage_loaded", False):
         load_persisted_state()
         st.session_state["_storage_loaded"] = True
@@ -2766,6 +2775,8 @@ CALENDAR_PAGE_LABEL = ("Kalender", "Calendar")
 NAVIGATION_SELECTION_KEY = "active_page"
 PENDING_NAVIGATION_KEY = "pending_active_page"
 GOOGLE_OAUTH_STATE_KEY = "google_oauth_state"
+GOOGLE_OAUTH_CODE_CONSUMED_KEY = "google_oauth_code_consumed"
+GOOGLE_OAUTH_URL_KEY = "google_oauth_url"
 GOOGLE_CONNECTED_EMAIL_KEY = "google_connected_email"
 GOOGLE_SMOKE_ITEMS_KEY = "google_smoke_items"
 GOOGLE_SMOKE_ERROR_KEY = "google_smoke_error"
@@ -2810,13 +2821,20 @@ def render_google_connection_panel() -> None:
         )
     )
 
+    # Only generate a state on first access; setdefault would draw fresh random bytes on every rerun.
     oauth_state = st.session_state.get(GOOGLE_OAUTH_STATE_KEY)
     if not oauth_state:
-        oauth_state = os.urandom(16).hex()
+        oauth_state = secrets.token_hex(16)
         st.session_state[GOOGLE_OAUTH_STATE_KEY] = oauth_state
 
+    # The URL only depends on the per-session OAuth state, so build it once per state value.
+    cached_auth_url = st.session_state.get(GOOGLE_OAUTH_URL_KEY)
     try:
-        auth_url = build_authorization_url(state=oauth_state, scopes=SCOPES_MAX_7)
+        if isinstance(cached_auth_url, tuple) and cached_auth_url[0] == oauth_state:
+            auth_url = cached_auth_url[1]
+        else:
+            auth_url = build_authorization_url(state=oauth_state, scopes=SCOPES_MAX_7)
+            st.session_state[GOOGLE_OAUTH_URL_KEY] = (oauth_state, auth_url)
     except OAuthConfigError:
         panel.error(
             translate_text(
@@ -2841,7 +2859,12 @@ def render_google_connection_panel() -> None:
     code = _get_first_query_param(st.query_params.get("code"))
     state = _get_first_query_param(st.query_params.get("state"))
     token_store = get_default_token_store()
-    if code:
+    code_fingerprint = hashlib.sha256(code.encode("utf-8")).hexdigest() if code else None
+    if code and st.session_state.get(GOOGLE_OAUTH_CODE_CONSUMED_KEY) == code_fingerprint:
+        # Authorization codes are single-use; a rerun that still sees the code in
+        # the URL must not trigger a second token exchange.
+        st.query_params.clear()
+    elif code:
         if not state or state != oauth_state:
             panel.error(
                 translate_text(
@@ -2852,6 +2875,7 @@ def render_google_connection_panel() -> None:
                 )
             )
             return
+        st.session_state[GOOGLE_OAUTH_CODE_CONSUMED_KEY] = code_fingerprint
         with panel.spinner(
             translate_text(("Google-Authentifizierung läuft...", "Completing Google authentication..."))
         ):
@@ -3724,6 +3748,13 @@ def main() -> None:
     )
     _inject_dark_theme_styles()
     storage_backend = _bootstrap_storage()
+    # Coalesce all state writes of one script run (including st.rerun/st.stop exits) into a single save
+    # and stamp every todo change of the run with the same clock reading.
+    with batch_saves(), frozen_now():
+        _render_app(storage_backend)
+
+
+def _render_app(storage_backend: FileStorageBackend) -> None:
     init_state()
     is_cloud = _is_streamlit_cloud()
 
@@ -464,6 +464,39 @@ def suggest_email_draft(
     )
 
 
+def request_milestone_suggestions(
+    todo_title: str,
+    *,
+    gamification_mode: GamificationMode,
+    client: OpenAI,
+    model: str,
+) -> MilestoneSuggestionList:
+    """Ask the model for milestones; raises ``LLMError`` instead of falling back."""
+
+    return request_structured_response(
+        client=client,
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You generate concise milestones for a task. "
+                    "Return 3-5 items, bilingual DE/EN titles. "
+                    "Adjust complexity (small/medium/large) and keep rationales short."
+                ),
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Task: {todo_title}. Gamification mode: {gamification_mode.label}. "
+                    "Provide realistic, actionable sub-steps."
+                ),
+            },
+        ],
+        response_model=MilestoneSuggestionList,
+    )
+
+
 def suggest_milestones(
     todo_title: str,
     *,
@@ -481,27 +514,11 @@ def suggest_milestones(
 
     if client_to_use:
         try:
-            result = request_structured_response(
+            result = request_milestone_suggestions(
+                todo_title,
+                gamification_mode=gamification_mode,
                 client=client_to_use,
                 model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You generate concise milestones for a task. "
-                            "Return 3-5 items, bilingual DE/EN titles. "
-                            "Adjust complexity (small/medium/large) and keep rationales short."
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": (
-                            f"Task: {todo_title}. Gamification mode: {gamification_mode.label}. "
-                            "Provide realistic, actionable sub-steps."
-                        ),
-                    },
-                ],
-                response_model=MilestoneSuggestionList,
             )
             return AISuggestion(result, from_ai=True)
         except LLMError:
@@ -552,6 +569,7 @@ def generate_motivation(stats: Optional[KpiStats] = None, client: Optional[OpenA
 __all__ = [
     "AISuggestion",
     "generate_motivation",
+    "request_milestone_suggestions",
     "suggest_email_draft",
     "suggest_daily_plan",
     "suggest_milestones",
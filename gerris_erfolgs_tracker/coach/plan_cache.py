@@ -0,0 +1,103 @@
+"""Reuse AI task plans for tasks that only differ in numbers.
+
+"Q3-Review vorbereiten" and "Q4-Review vorbereiten" share one cache key, so the
+second task gets the first plan with its numbers swapped and its milestone
+dates shifted to the new start date instead of another reasoning-model call.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from pydantic import ValidationError
+
+from gerris_erfolgs_tracker.coach.task_analyzer_models import TaskAIProposal
+
+PLAN_CACHE_CAPACITY = 200
+
+_NUMBER_RE = re.compile(r"\d+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def plan_cache_key(title: str, description: str = "") -> str:
+    """Normalize a task to its cache key: case-folded, numbers masked, whitespace collapsed."""
+
+    text = _NUMBER_RE.sub("#", f"{title} {description}".casefold())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+@dataclass
+class _PlanTemplate:
+    numbers: tuple[str, ...]
+    proposal: dict[str, Any]
+    due_offsets: tuple[int | None, ...]
+    hits: int = 0
+
+
+class PlanCache:
+    """Session-local plan templates with least-frequently-used eviction."""
+
+    def __init__(self, capacity: int = PLAN_CACHE_CAPACITY) -> None:
+        self.capacity = capacity
+        self._templates: dict[str, _PlanTemplate] = {}
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def store(self, title: str, description: str, proposal: TaskAIProposal) -> None:
+        key = plan_cache_key(title, description)
+        if key not in self._templates and len(self._templates) >= self.capacity:
+            # Ties go to the oldest template because dicts keep insertion order.
+            del self._templates[min(self._templates, key=lambda name: self._templates[name].hits)]
+
+        start = proposal.start_date or date.today()
+        self._templates[key] = _PlanTemplate(
+            numbers=tuple(_NUMBER_RE.findall(f"{title} {description}")),
+            proposal=proposal.model_dump(exclude={"start_date", "due_date"}),
+            due_offsets=tuple(
+                (item.suggested_due - start).days if item.suggested_due else None for item in proposal.milestone_plan
+            ),
+        )
+
+    def adapt(
+        self,
+        title: str,
+        description: str,
+        *,
+        start_date: date,
+        due_date: date | None,
+    ) -> TaskAIProposal | None:
+        """Return the cached plan rewritten for this task, or ``None`` on a miss.
+
+        A plan whose shifted milestone dates no longer fit the new due date
+        counts as a miss.
+        """
+
+        template = self._templates.get(plan_cache_key(title, description))
+        if template is None:
+            return None
+
+        replacements = dict(zip(template.numbers, _NUMBER_RE.findall(f"{title} {description}"), strict=False))
+        plan = [
+            item
+            | {
+                "title": _NUMBER_RE.sub(lambda match: replacements.get(match.group(), match.group()), item["title"]),
+                "suggested_due": start_date + timedelta(days=offset) if offset is not None else None,
+            }
+            for item, offset in zip(template.proposal["milestone_plan"], template.due_offsets, strict=True)
+        ]
+        try:
+            proposal = TaskAIProposal.model_validate(
+                template.proposal | {"milestone_plan": plan, "start_date": start_date, "due_date": due_date}
+            )
+        except ValidationError:
+            return None
+
+        template.hits += 1
+        return proposal
+
+
+__all__ = ["PLAN_CACHE_CAPACITY", "PlanCache", "plan_cache_key"]
@@ -25,12 +25,24 @@ def cap_list_tail(values: List[T], limit: int) -> List[T]:
     return values[-limit:]
 
 
+def append_capped(values: List[T], item: T, limit: int) -> List[T]:
+    """Append ``item`` in place and drop the oldest entries beyond ``limit``."""
+
+    values.append(item)
+    if limit <= 0:
+        values.clear()
+    elif len(values) > limit:
+        del values[:-limit]
+    return values
+
+
 SS_TODOS: str = "todos"
 SS_STATS: str = "stats"
 SS_SETTINGS: str = "settings"
 SS_GAMIFICATION: str = "gamification"
 SS_JOURNAL: str = "journal_entries"
 SS_COACH: str = "coach"
+STORAGE_BACKEND_KEY: str = "_storage_backend"
 JOURNAL_COMPLETION_PROMPT_KEY: str = "journal_completion_prompt"
 JOURNAL_COMPLETION_NOTE_KEY: str = "journal_completion_note"
 
@@ -84,6 +96,7 @@ NEW_MILESTONE_SUGGESTIONS_KEY: str = "new_milestone_suggestions"
 NEW_TODO_DRAFT_MILESTONES_KEY: str = "new_todo_draft_milestones"
 TASK_AI_PROPOSAL_KEY: str = "task_ai_proposal"
 TASK_AI_PROPOSAL_APPLY_KEY: str = "task_ai_proposal_apply"
+TASK_AI_PLAN_CACHE_KEY: str = "task_ai_plan_cache"
 AVATAR_PROMPT_INDEX_KEY: str = "avatar_prompt_index"
 FILTER_SHOW_DONE_KEY: str = "filter_show_done"
 FILTER_SELECTED_CATEGORIES_KEY: str = "filter_selected_categories"
@@ -102,20 +102,26 @@ QUADRANT_METADATA: Mapping[EisenhowerQuadrant, QuadrantMetadata] = {
 SortKey = Literal["due_date", "created_at", "title"]
 
 
+def _build_label_lookup() -> dict[str, EisenhowerQuadrant]:
+    lookup: dict[str, EisenhowerQuadrant] = {}
+    for quadrant, metadata in QUADRANT_METADATA.items():
+        for label in (metadata.label_de, metadata.label_en, metadata.short_label, *metadata.legacy_labels):
+            lookup.setdefault(label.lower(), quadrant)
+    return lookup
+
+
+# Lower-cased labels (current and legacy) mapped to their quadrant, built once
+# so ``ensure_quadrant`` does not rebuild the candidate tuples on every call.
+_QUADRANT_BY_LABEL: Mapping[str, EisenhowerQuadrant] = _build_label_lookup()
+
+
 def ensure_quadrant(value: EisenhowerQuadrant | str) -> EisenhowerQuadrant:
     if isinstance(value, EisenhowerQuadrant):
         return value
 
-    normalized = value.strip().lower()
-    for quadrant, metadata in QUADRANT_METADATA.items():
-        candidate_labels = (
-            metadata.label_de.lower(),
-            metadata.label_en.lower(),
-            metadata.short_label.lower(),
-            *(label.lower() for label in metadata.legacy_labels),
-        )
-        if normalized in candidate_labels:
-            return quadrant
+    quadrant = _QUADRANT_BY_LABEL.get(value.strip().lower())
+    if quadrant is not None:
+        return quadrant
     try:
         return EisenhowerQuadrant(value)
     except ValueError as exc:  # noqa: TRY003
@@ -134,16 +140,17 @@ def group_by_quadrant(
     return dict(grouped)
 
 
+_UTC_MAX = datetime.max.replace(tzinfo=timezone.utc)
+
+
 def _due_date_sort_key(todo: "TodoItem") -> tuple[int, datetime]:
-    fallback = datetime.max.replace(tzinfo=timezone.utc)
-    due_date = todo.due_date or fallback
+    due_date = todo.due_date or _UTC_MAX
     normalized = due_date if due_date.tzinfo else due_date.replace(tzinfo=timezone.utc)
     return (0 if todo.due_date is not None else 1, normalized)
 
 
 def _created_at_sort_key(todo: "TodoItem") -> tuple[bool, datetime]:
-    fallback = datetime.max.replace(tzinfo=timezone.utc)
-    created_at = todo.created_at or fallback
+    created_at = todo.created_at or _UTC_MAX
     normalized = created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
     return (todo.created_at is None, normalized)
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Iterable, Literal, Mapping, Protocol, cast
 
 import streamlit as st
@@ -45,12 +45,21 @@ def translate_text(text: str | tuple[str, str]) -> str:
         german, _english = text
         return german
 
-    if isinstance(text, str) and " / " in text:
-        fragments = text.split(" / ")
-        german_text = " ".join(fragments[::2]).strip()
-        return german_text
+    if isinstance(text, str):
+        return _translate_string(text)
+
+    return text
 
-    return text if isinstance(text, str) else text
+
+@lru_cache(maxsize=4096)
+def _translate_string(text: str) -> str:
+    # Streamlit reruns the whole script on every interaction, so the same
+    # labels (and long markdown blocks) come through here again and again.
+    # German is the only language, so the text alone is a complete cache key.
+    if " / " in text:
+        fragments = text.split(" / ")
+        return " ".join(fragments[::2]).strip()
+    return text
 
 
 def translate_value(value: object) -> object:
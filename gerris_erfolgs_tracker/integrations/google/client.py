@@ -1,23 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+_RETRIABLE_STATUS_CODES = frozenset({408, 429})
+
 
 class GoogleApiError(RuntimeError):
-    pass
+    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retriable(self) -> bool:
+        """Network failures, rate limits and server errors may succeed on a retry."""
+
+        if self.status_code is None:
+            return True
+        return self.status_code in _RETRIABLE_STATUS_CODES or self.status_code >= 500
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    # One pooled client for all Google calls, so later requests reuse open TLS connections.
+    return httpx.Client()
 
 
 @dataclass(frozen=True)
 class GoogleApiClient:
     access_token: str
     timeout: float = 10.0
+    http_client: httpx.Client | None = field(default=None, repr=False, compare=False)
+
+    def _http(self) -> httpx.Client:
+        return self.http_client or _shared_http_client()
 
     def get(self, url: str, *, params: dict[str, Any] | None = None) -> dict[str, Any]:
         try:
-            response = httpx.get(
+            response = self._http().get(
                 url,
                 headers={"Authorization": f"Bearer {self.access_token}"},
                 params=params,
@@ -27,15 +50,15 @@ class GoogleApiClient:
             raise GoogleApiError("Google API request failed.") from exc
         if response.status_code >= 400:
             message = _extract_error_message(response)
-            raise GoogleApiError(message)
+            raise GoogleApiError(message, status_code=response.status_code)
         data = response.json()
         if not isinstance(data, dict):
-            raise GoogleApiError("Google API returned an unexpected response.")
+            raise GoogleApiError("Google API returned an unexpected response.", status_code=response.status_code)
         return data
 
     def post(self, url: str, *, json: dict[str, Any]) -> dict[str, Any]:
         try:
-            response = httpx.post(
+            response = self._http().post(
                 url,
                 headers={"Authorization": f"Bearer {self.access_token}"},
                 json=json,
@@ -45,15 +68,20 @@ class GoogleApiClient:
             raise GoogleApiError("Google API request failed.") from exc
         if response.status_code >= 400:
             message = _extract_error_message(response)
-            raise GoogleApiError(message)
+            raise GoogleApiError(message, status_code=response.status_code)
         data = response.json()
         if not isinstance(data, dict):
-            raise GoogleApiError("Google API returned an unexpected response.")
+            raise GoogleApiError("Google API returned an unexpected response.", status_code=response.status_code)
         return data
 
 
-def build_google_api_client(access_token: str, *, timeout: float = 10.0) -> GoogleApiClient:
-    return GoogleApiClient(access_token=access_token, timeout=timeout)
+def build_google_api_client(
+    access_token: str,
+    *,
+    timeout: float = 10.0,
+    http_client: httpx.Client | None = None,
+) -> GoogleApiClient:
+    return GoogleApiClient(access_token=access_token, timeout=timeout, http_client=http_client)
 
 
 def _extract_error_message(response: httpx.Response) -> str:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import time
+from functools import lru_cache
 from typing import Any, Iterable, Optional, Sequence, TypeVar
 
 import streamlit as st
@@ -49,13 +50,21 @@ def get_default_model(reasoning: bool = False) -> str:
 
 
 def get_openai_client() -> Optional[OpenAI]:
-    """Create an OpenAI client from secrets or environment variables."""
+    """Return an OpenAI client configured from secrets or environment variables.
+
+    Clients are shared per ``(api_key, base_url)`` so reruns and pages reuse the
+    same HTTP connection pool instead of building a new client each time.
+    """
 
     api_key = _get_secret("OPENAI_API_KEY")
     if not api_key:
         return None
 
-    base_url = _get_secret("OPENAI_BASE_URL")
+    return _build_openai_client(api_key, _get_secret("OPENAI_BASE_URL"))
+
+
+@lru_cache(maxsize=4)
+def _build_openai_client(api_key: str, base_url: Optional[str]) -> OpenAI:
     client_kwargs: dict[str, str] = {"api_key": api_key}
     if base_url:
         client_kwargs["base_url"] = base_url
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from datetime import date, datetime, timezone
 from enum import Enum
+from itertools import pairwise
+from operator import attrgetter
 from typing import List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
 
@@ -13,6 +15,8 @@ from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
 class KanbanColumn(BaseModel):
     """Column inside a per-task kanban board."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid4()))
     title: str
     order: int
@@ -21,6 +25,8 @@ class KanbanColumn(BaseModel):
 class KanbanCard(BaseModel):
     """Card representing a subtask in the per-task kanban board."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid4()))
     title: str
     description_md: str = ""
@@ -59,8 +65,50 @@ class TodoKanban(BaseModel):
             columns,
             key=lambda item: (order_lookup.get(item.id, item.order), item.order, item.title.lower()),
         )
+        if len(sorted_columns) == len(self.columns) and all(
+            column is current for column, current in zip(sorted_columns, self.columns, strict=True)
+        ):
+            return self
         return self.model_copy(update={"columns": sorted_columns})
 
+    def ordered_columns(self) -> tuple[KanbanColumn, ...]:
+        """Return the columns sorted by their ``order`` value."""
+
+        return tuple(sorted(self.columns, key=attrgetter("order")))
+
+    def ordered_column_ids(self) -> tuple[str, ...]:
+        """Return the ids of ``ordered_columns``."""
+
+        return tuple(column.id for column in self.ordered_columns())
+
+    def column_position(self, column_id: str) -> Optional[int]:
+        """Return the position of ``column_id`` in ``ordered_column_ids``."""
+
+        ordered_ids = self.ordered_column_ids()
+        return ordered_ids.index(column_id) if column_id in ordered_ids else None
+
+    def card_position(self, card_id: str) -> Optional[int]:
+        """Return the list position of the card with ``card_id``."""
+
+        return next((position for position, card in enumerate(self.cards) if card.id == card_id), None)
+
+    def cards_by_created(self) -> list[KanbanCard]:
+        """Return the cards ordered by ``created_at``.
+
+        Cards are appended as they are created, so the list is normally in
+        order already and is returned as is; only out-of-order data is sorted.
+        """
+
+        cards = self.cards
+        if all(previous.created_at <= card.created_at for previous, card in pairwise(cards)):
+            return cards
+        return sorted(cards, key=attrgetter("created_at"))
+
+    def with_own_cards(self) -> "TodoKanban":
+        """Return a shallow copy with its own cards list for in-place edits."""
+
+        return self.model_copy(update={"cards": list(self.cards)})
+
     def backlog_column_id(self) -> str:
         for column in self.columns:
             if column.id == "backlog":
@@ -178,6 +226,8 @@ class MilestoneStatus(str, Enum):
 class Milestone(BaseModel):
     """Sub-goal within a todo with optional gamification points."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid4()))
     title: str
     points: int = 0
@@ -220,6 +270,11 @@ class TodoItem(BaseModel):
     reminder_at: Optional[datetime] = None
     reminder_sent_at: Optional[datetime] = None
 
+    def has_processed_progress_event(self, event_id: str) -> bool:
+        """Return True if ``event_id`` was already applied to this todo."""
+
+        return event_id in self.processed_progress_events
+
     @model_validator(mode="after")
     def _ensure_timezone_awareness(self) -> "TodoItem":
         def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
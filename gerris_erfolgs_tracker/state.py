@@ -28,6 +28,7 @@ from gerris_erfolgs_tracker.models import (
 )
 from gerris_erfolgs_tracker.notifications.reminders import calculate_reminder_at
 from gerris_erfolgs_tracker.state_persistence import (
+    batch_saves,
     configure_storage,
     load_persisted_state,
     persist_state,
@@ -36,13 +37,18 @@ from gerris_erfolgs_tracker.state_persistence import (
 __all__ = [
     "init_state",
     "get_todos",
+    "find_todo_index",
     "save_todos",
     "reset_state",
+    "batch_saves",
     "configure_storage",
     "load_persisted_state",
     "persist_state",
 ]
 
+TODO_INDEX_KEY = "_todo_index"
+TODO_MODELS_KEY = "_todo_models"
+
 
 def _default_todos() -> List[TodoItem]:
     return []
@@ -178,10 +184,53 @@ def init_state() -> None:
     persist_state()
 
 
+def _raw_todo_id(raw: Any) -> Any:
+    if isinstance(raw, TodoItem):
+        return raw.id
+    if isinstance(raw, dict):
+        return raw.get("id")
+    return None
+
+
+def _store_todo_index(raw_todos: object, todo_ids: Iterable[Any]) -> dict[str, int]:
+    index: dict[str, int] = {}
+    for position, todo_id in enumerate(todo_ids):
+        if isinstance(todo_id, str):
+            index.setdefault(todo_id, position)
+    st.session_state[TODO_INDEX_KEY] = (raw_todos, index)
+    return index
+
+
+def find_todo_index(todo_id: str) -> int | None:
+    """Return the position of ``todo_id`` in the stored todo list.
+
+    The id-to-position map is cached alongside the stored list and rebuilt
+    whenever the list in session state is replaced.
+    """
+
+    raw_todos = st.session_state.get(SS_TODOS, [])
+    cached = st.session_state.get(TODO_INDEX_KEY)
+    if isinstance(cached, tuple) and cached[0] is raw_todos:
+        index: dict[str, int] = cached[1]
+    else:
+        index = _store_todo_index(raw_todos, (_raw_todo_id(raw) for raw in raw_todos))
+    return index.get(todo_id)
+
+
 def get_todos() -> List[TodoItem]:
-    """Return todo items from session state as TodoItem models."""
+    """Return todo items from session state as TodoItem models.
+
+    The models written by ``save_todos`` are reused as long as the stored list
+    has not been replaced, so repeated reads skip validation. Callers get a
+    fresh list; the models themselves are shared, so prefer ``model_copy`` and
+    save the result with ``save_todos``.
+    """
 
     raw_todos: Iterable[Any] = st.session_state.get(SS_TODOS, [])
+    cached = st.session_state.get(TODO_MODELS_KEY)
+    if isinstance(cached, tuple) and cached[0] is raw_todos:
+        return list(cached[1])
+
     todos: List[TodoItem] = []
     mutated = False
     for raw in raw_todos:
@@ -198,7 +247,12 @@ def get_todos() -> List[TodoItem]:
 def save_todos(todos: Sequence[TodoItem]) -> None:
     """Persist todo items back to session state."""
 
-    st.session_state[SS_TODOS] = [todo.model_dump() for todo in todos]
+    # Always dump every model: cached models are shared between callers, so an
+    # in-place edit must not be hidden behind a dump taken before it.
+    raw_todos = [todo.model_dump() for todo in todos]
+    st.session_state[SS_TODOS] = raw_todos
+    st.session_state[TODO_MODELS_KEY] = (raw_todos, tuple(todos))
+    _store_todo_index(raw_todos, (todo.id for todo in todos))
     persist_state()
 
 
@@ -208,4 +262,6 @@ def reset_state() -> None:
     for key in (SS_TODOS, SS_STATS, SS_GAMIFICATION, SS_SETTINGS, SS_JOURNAL, SS_COACH):
         if key in st.session_state:
             del st.session_state[key]
+    st.session_state.pop(TODO_INDEX_KEY, None)
+    st.session_state.pop(TODO_MODELS_KEY, None)
     init_state()
@@ -1,39 +1,56 @@
 from __future__ import annotations
 
-import json
 import logging
-from typing import Mapping
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Mapping
 
 import streamlit as st
-from pydantic_core import to_jsonable_python
 
-from gerris_erfolgs_tracker.constants import SS_COACH, SS_GAMIFICATION, SS_JOURNAL, SS_SETTINGS, SS_STATS, SS_TODOS
+from gerris_erfolgs_tracker.constants import (
+    SS_COACH,
+    SS_GAMIFICATION,
+    SS_JOURNAL,
+    SS_SETTINGS,
+    SS_STATS,
+    SS_TODOS,
+    STORAGE_BACKEND_KEY,
+)
 from gerris_erfolgs_tracker.storage import StorageBackend
 
 LOGGER = logging.getLogger(__name__)
 
 PERSISTED_KEYS: tuple[str, ...] = (SS_TODOS, SS_STATS, SS_GAMIFICATION, SS_SETTINGS, SS_JOURNAL, SS_COACH)
-_storage_backend: StorageBackend | None = None
-_last_persisted_fingerprint: str | None = None
+_batch_state = threading.local()
 
 
 def configure_storage(backend: StorageBackend | None) -> None:
-    """Register a storage backend to persist state changes."""
+    """Register the session's storage backend to persist state changes.
 
-    global _storage_backend, _last_persisted_fingerprint
+    The backend lives in the session state rather than the module, because a
+    backend remembers what its session last saved; sharing one between
+    sessions would diff each session's state against another's.
+    """
 
-    _storage_backend = backend
-    _last_persisted_fingerprint = None
+    if backend is None:
+        st.session_state.pop(STORAGE_BACKEND_KEY, None)
+    else:
+        st.session_state[STORAGE_BACKEND_KEY] = backend
+
+
+def _session_backend() -> StorageBackend | None:
+    return st.session_state.get(STORAGE_BACKEND_KEY)
 
 
 def load_persisted_state() -> None:
     """Hydrate the Streamlit session state from the configured backend."""
 
-    if _storage_backend is None:
+    backend = _session_backend()
+    if backend is None:
         return
 
     try:
-        persisted = _storage_backend.load_state()
+        persisted = backend.load_state()
     except Exception as exc:  # pragma: no cover - defensive logging
         LOGGER.warning("Failed to load persisted state: %s", exc)
         st.warning(
@@ -48,21 +65,39 @@ def load_persisted_state() -> None:
     st.session_state.update(persisted)
 
 
+@contextmanager
+def batch_saves() -> Iterator[None]:
+    """Coalesce ``persist_state`` calls inside the block into one write on exit.
+
+    Nested blocks only flush when the outermost block exits. Session state is
+    still updated immediately, so reads inside the block see fresh values.
+    """
+
+    depth: int = getattr(_batch_state, "depth", 0)
+    _batch_state.depth = depth + 1
+    try:
+        yield
+    finally:
+        _batch_state.depth = depth
+        if depth == 0 and getattr(_batch_state, "dirty", False):
+            _batch_state.dirty = False
+            persist_state()
+
+
 def persist_state() -> None:
     """Persist the managed session state keys using the configured backend."""
 
-    global _last_persisted_fingerprint
-
-    if _storage_backend is None:
+    backend = _session_backend()
+    if backend is None:
         return
 
-    payload = {key: st.session_state.get(key) for key in PERSISTED_KEYS if key in st.session_state}
-    serialized_payload = json.dumps(payload, default=to_jsonable_python, sort_keys=True)
-    if _last_persisted_fingerprint == serialized_payload:
+    if getattr(_batch_state, "depth", 0):
+        _batch_state.dirty = True
         return
 
+    payload: dict[str, object] = {key: st.session_state.get(key) for key in PERSISTED_KEYS if key in st.session_state}
+
     try:
-        _storage_backend.save_state(payload)
-        _last_persisted_fingerprint = serialized_payload
+        backend.save_state(payload)
     except Exception as exc:  # pragma: no cover - defensive logging
         LOGGER.warning("Failed to persist state: %s", exc)
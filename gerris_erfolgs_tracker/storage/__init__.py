@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import os
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Mapping, Protocol, Sequence
 
-from pydantic_core import to_jsonable_python
+from pydantic_core import from_json, to_json
 
+from gerris_erfolgs_tracker.constants import SS_TODOS
 from gerris_erfolgs_tracker.models import AttachmentRef
 
 ATTACHMENTS_FOLDER_NAME = "attachments"
@@ -24,6 +26,10 @@ class StorageBackend(Protocol):
 
 
 DEFAULT_STATE_FILENAME = "gerris_state.json"
+MUTATION_LOG_SUFFIX = ".mutations.jsonl"
+MUTATION_LOG_COMPACT_THRESHOLD = 500
+# Keys holding lists of ``{"id": ...}`` records that are logged per item.
+ITEMIZED_STATE_KEYS: tuple[str, ...] = (SS_TODOS,)
 TRACKER_FOLDER_NAME = "GerrisErfolgsTracker"
 
 
@@ -114,14 +120,14 @@ def store_attachments(
     if not payloads:
         return []
 
-    attachment_dir = resolve_attachment_directory(todo_id, path=path, env=env)
+    attachment_dir = os.fspath(resolve_attachment_directory(todo_id, path=path, env=env))
+    relative_dir = os.path.join(ATTACHMENTS_FOLDER_NAME, todo_id)
     references: list[AttachmentRef] = []
     for payload in payloads:
-        filename = Path(payload.filename).name
-        target_path = attachment_dir / filename
-        target_path.write_bytes(payload.data)
-        relative_path = Path(ATTACHMENTS_FOLDER_NAME) / todo_id / filename
-        references.append(AttachmentRef(filename=filename, relative_path=str(relative_path)))
+        filename = os.path.basename(payload.filename)
+        with open(os.path.join(attachment_dir, filename), "wb") as file_handle:
+            file_handle.write(payload.data)
+        references.append(AttachmentRef(filename=filename, relative_path=os.path.join(relative_dir, filename)))
     return references
 
 
@@ -135,30 +141,226 @@ def resolve_attachment_path(
     return tracker_dir / relative_reference
 
 
+def _itemize(value: object) -> dict[str, bytes] | None:
+    if not isinstance(value, list):
+        return None
+
+    items: dict[str, bytes] = {}
+    for item in value:
+        item_id = item.get("id") if isinstance(item, Mapping) else None
+        if not isinstance(item_id, str) or item_id in items:
+            return None
+        items[item_id] = to_json(item)
+    return items
+
+
+class _SerializedState:
+    """Per-key (and per-record) JSON of a state mapping, serialized once."""
+
+    def __init__(self, state: Mapping[str, object]) -> None:
+        self.values: dict[str, bytes] = {}
+        self.items: dict[str, dict[str, bytes]] = {}
+        for key, value in state.items():
+            items = _itemize(value) if key in ITEMIZED_STATE_KEYS else None
+            if items is None:
+                self.values[key] = to_json(value)
+            else:
+                self.items[key] = items
+                self.values[key] = b"[" + b", ".join(items.values()) + b"]"
+
+    def document(self) -> bytes:
+        return b"{" + b", ".join(to_json(key) + b": " + self.values[key] for key in sorted(self.values)) + b"}"
+
+
 class FileStorageBackend:
-    """Persist state to a JSON file on disk."""
+    """Persist state to a JSON snapshot plus an append-only mutation log.
+
+    Saves append only the changed keys (and, for ``ITEMIZED_STATE_KEYS``, only
+    the changed records) to ``<state>.mutations.jsonl``. The log is replayed on
+    load and folded back into the snapshot every
+    ``MUTATION_LOG_COMPACT_THRESHOLD`` entries. The log only extends the
+    snapshot read by ``load_state``; an instance that has not loaded one writes
+    a full snapshot instead, so keep one instance per session.
+
+    The first log line names the snapshot generation (a digest of the snapshot
+    bytes) it extends. A log left behind by an interrupted compaction belongs
+    to an older generation and is ignored on load and replaced on the next
+    append, so it can never roll the newer snapshot back.
+    """
 
     def __init__(self, path: str | Path | None = None) -> None:
         self.path = resolve_state_file_path(path)
-        self._last_fingerprint: str | None = None
+        self.log_path = self.path.with_name(self.path.stem + MUTATION_LOG_SUFFIX)
+        self._baseline: _SerializedState | None = None
+        self._log_entries = 0
+        self._generation: str | None = None
+        self._log_generation: str | None = None
 
     def load_state(self) -> Mapping[str, object]:
         if not self.path.exists():
+            # Without its snapshot a leftover log would replay onto nothing
+            # (e.g. after a reset by deleting the file), so drop it. The next
+            # save writes a fresh snapshot because no baseline is set.
+            self.log_path.unlink(missing_ok=True)
+            self._baseline = None
+            self._log_entries = 0
+            self._generation = self._log_generation = None
             return {}
 
-        with self.path.open("r", encoding="utf-8") as file_handle:
-            return json.load(file_handle)
+        document = self.path.read_bytes()
+        state: dict[str, object] = dict(from_json(document))
+        self._generation = _snapshot_generation(document)
+        self._log_entries = self._replay_log(state)
+        self._baseline = _SerializedState(state)
+        return state
 
     def save_state(self, state: Mapping[str, object]) -> None:
-        serialized = json.dumps(state, default=to_jsonable_python, ensure_ascii=False, sort_keys=True)
-        if serialized == self._last_fingerprint:
+        current = _SerializedState(state)
+        if self._baseline is not None and current.values == self._baseline.values:
             return
 
+        if self._baseline is None or self._log_entries >= MUTATION_LOG_COMPACT_THRESHOLD:
+            self._write_snapshot(current)
+        else:
+            self._append_mutations(self._baseline, current)
+        self._baseline = current
+
+    def _write_snapshot(self, current: _SerializedState) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as file_handle:
-            file_handle.write(serialized)
+        # Write next to the target and swap it in, so an interrupted save never
+        # leaves a truncated snapshot behind.
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        document = current.document()
+        temp_path.write_bytes(document)
+        os.replace(temp_path, self.path)
+        self._generation = _snapshot_generation(document)
+        self._log_generation = None
+        self._log_entries = 0
+
+        # The old log no longer matches the new generation, so failing to
+        # remove it (e.g. a sync client holding the file) is harmless.
+        with suppress(OSError):
+            self.log_path.unlink(missing_ok=True)
+
+    def _append_mutations(self, previous: _SerializedState, current: _SerializedState) -> None:
+        lines: list[bytes] = [
+            to_json({"op": "unset", "key": key}) for key in sorted(previous.values.keys() - current.values.keys())
+        ]
+        for key, value_json in current.values.items():
+            if previous.values.get(key) == value_json:
+                continue
+
+            previous_items = previous.items.get(key)
+            items = current.items.get(key)
+            if previous_items is None or items is None or not _is_append_compatible(previous_items, items):
+                lines.append(b'{"key": ' + to_json(key) + b', "op": "set", "value": ' + value_json + b"}")
+                continue
+
+            for item_id in previous_items.keys() - items.keys():
+                lines.append(to_json({"op": "delete", "key": key, "id": item_id}))
+            for item_id, item_json in items.items():
+                if previous_items.get(item_id) != item_json:
+                    lines.append(
+                        b'{"id": '
+                        + to_json(item_id)
+                        + b', "key": '
+                        + to_json(key)
+                        + b', "op": "upsert", "value": '
+                        + item_json
+                        + b"}"
+                    )
 
-        self._last_fingerprint = serialized
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._log_generation == self._generation:
+            mode = "ab"
+        else:
+            # Start a fresh log for the current snapshot, replacing any stale one.
+            mode = "wb"
+            lines.insert(0, to_json({"op": "snapshot", "generation": self._generation}))
+        with self.log_path.open(mode) as file_handle:
+            file_handle.writelines(line + b"\n" for line in lines)
+        self._log_generation = self._generation
+        self._log_entries += len(lines) - (mode == "wb")
+
+    def _replay_log(self, state: dict[str, object]) -> int:
+        self._log_generation = None
+        if not self.log_path.exists():
+            return 0
+
+        itemized: dict[str, dict[str, object]] = {}
+        applied = 0
+        last_line = b""
+        torn_tail = False
+        with self.log_path.open("rb") as file_handle:
+            try:
+                header = from_json(file_handle.readline())
+            except ValueError:
+                return 0
+            if not isinstance(header, dict) or header.get("generation") != self._generation:
+                # Written for another snapshot; replaying it would roll state back.
+                return 0
+            self._log_generation = self._generation
+
+            for line in file_handle:
+                last_line = line
+                try:
+                    entry = from_json(line)
+                except ValueError:
+                    # A torn final line from an interrupted write; earlier entries still apply.
+                    torn_tail = True
+                    continue
+                torn_tail = False
+
+                key = entry.get("key")
+                operation = entry.get("op")
+                if operation in {"upsert", "delete"}:
+                    records = itemized.get(key)
+                    if records is None:
+                        existing = state.get(key)
+                        records = {
+                            str(item.get("id")): item for item in (existing if isinstance(existing, list) else [])
+                        }
+                        itemized[key] = records
+                    if operation == "upsert":
+                        records[entry["id"]] = entry["value"]
+                    else:
+                        records.pop(entry["id"], None)
+                else:
+                    if key in itemized:
+                        del itemized[key]
+                    if operation == "set":
+                        state[key] = entry["value"]
+                    else:
+                        state.pop(key, None)
+                applied += 1
+
+        if last_line and not last_line.endswith(b"\n"):
+            # Appends must start on a fresh line, or the next entry would be
+            # glued onto this one and lost on replay.
+            if torn_tail:
+                os.truncate(self.log_path, self.log_path.stat().st_size - len(last_line))
+            else:
+                with self.log_path.open("ab") as file_handle:
+                    file_handle.write(b"\n")
+
+        for key, records in itemized.items():
+            state[key] = list(records.values())
+        return applied
+
+
+def _snapshot_generation(document: bytes) -> str:
+    return hashlib.blake2b(document, digest_size=8).hexdigest()
+
+
+def _is_append_compatible(previous: Mapping[str, bytes], current: Mapping[str, bytes]) -> bool:
+    """Return True if ``current`` keeps the surviving records in their old order.
+
+    Replaying upserts appends new ids at the end, so any other reordering has to
+    be logged as a full ``set`` of the key.
+    """
+
+    surviving = [item_id for item_id in previous if item_id in current]
+    return list(current)[: len(surviving)] == surviving
 
 
 __all__ = [
@@ -171,6 +373,7 @@ __all__ = [
     "store_attachments",
     "AttachmentPayload",
     "DEFAULT_STATE_FILENAME",
+    "MUTATION_LOG_SUFFIX",
     "TRACKER_FOLDER_NAME",
     "ATTACHMENTS_FOLDER_NAME",
 ]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from calendar import monthrange
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Callable, Final, Literal, Optional, Sequence
+from functools import lru_cache
+from typing import Callable, Final, Iterator, Literal, Optional, Sequence
 from uuid import UUID, uuid5
 
-from gerris_erfolgs_tracker.constants import PROCESSED_PROGRESS_EVENTS_LIMIT, cap_list_tail
+from gerris_erfolgs_tracker import gamification, kpis
+from gerris_erfolgs_tracker.constants import PROCESSED_PROGRESS_EVENTS_LIMIT, append_capped
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant, ensure_quadrant
 from gerris_erfolgs_tracker.gamification import award_milestone_points, award_progress_points
 from gerris_erfolgs_tracker.models import (
@@ -21,27 +25,87 @@ from gerris_erfolgs_tracker.models import (
     TodoKanban,
 )
 from gerris_erfolgs_tracker.notifications.reminders import calculate_reminder_at
-from gerris_erfolgs_tracker.state import get_todos, save_todos
+from gerris_erfolgs_tracker.state import batch_saves, find_todo_index, get_todos, save_todos
 from gerris_erfolgs_tracker.storage import AttachmentPayload, store_attachments
 
 _UNSET: Final = object()
 _RECURRENCE_SPAWN_NAMESPACE = UUID("c1c4db05-050c-4b1a-9c8a-2f2b5756fa0c")
+_REMINDER_INPUT_FIELDS: Final[frozenset[str]] = frozenset({"due_date", "email_reminder"})
+_FROZEN_NOW: ContextVar[Optional[datetime]] = ContextVar("gerris_todos_frozen_now", default=None)
+
+
+def _now() -> datetime:
+    frozen = _FROZEN_NOW.get()
+    return frozen if frozen is not None else datetime.now(timezone.utc)
+
+
+@contextmanager
+def frozen_now() -> Iterator[datetime]:
+    """Read the clock once and reuse it for every todo timestamp in the block.
+
+    Nested blocks keep the outer value so bulk operations share one timestamp.
+    """
+
+    outer = _FROZEN_NOW.get()
+    if outer is not None:
+        yield outer
+        return
+
+    token = _FROZEN_NOW.set(datetime.now(timezone.utc))
+    try:
+        yield _now()
+    finally:
+        _FROZEN_NOW.reset(token)
 
 
 def _ensure_kanban(todo: TodoItem) -> TodoKanban:
-    kanban = todo.kanban.ensure_default_columns()
-    return kanban
+    # The board copy gets its own cards list so in-place edits do not leak into
+    # the cached todo models; the columns list stays shared.
+    return todo.kanban.ensure_default_columns().with_own_cards()
+
 
+@lru_cache(maxsize=1024)
+def _reminder_at(due_date: Optional[datetime], email_reminder: EmailReminderOffset) -> Optional[datetime]:
+    return calculate_reminder_at(due_date, email_reminder)
 
-def _refresh_reminder(todo: TodoItem, *, previous: TodoItem | None = None) -> TodoItem:
-    reminder_at = calculate_reminder_at(todo.due_date, todo.email_reminder)
-    previous_reminder = previous.reminder_at if previous is not None else None
-    reminder_sent_at = todo.reminder_sent_at
 
+def _apply_reminder(todo: TodoItem, *, previous_reminder: Optional[datetime] = None) -> None:
+    """Recompute reminder fields on a todo this module owns exclusively."""
+
+    reminder_at = _reminder_at(todo.due_date, todo.email_reminder)
+    todo.reminder_at = reminder_at
     if reminder_at != previous_reminder:
-        reminder_sent_at = None
+        todo.reminder_sent_at = None
+
+
+def _reaches_auto_completion(todo: TodoItem) -> bool:
+    return (
+        todo.progress_target is not None
+        and todo.auto_done_when_target_reached
+        and todo.progress_current >= todo.progress_target
+        and not todo.completed
+    )
+
+
+def _apply_auto_completion(todo: TodoItem) -> None:
+    if _reaches_auto_completion(todo):
+        todo.completed = True
+        todo.completed_at = _now()
+
+
+def _materialize_todo(todo: TodoItem, updates: dict[str, object]) -> TodoItem:
+    """Return ``todo`` with ``updates`` applied using a single model copy.
 
-    return todo.model_copy(update={"reminder_at": reminder_at, "reminder_sent_at": reminder_sent_at})
+    Derived reminder and auto-completion fields are settled on the fresh copy
+    instead of producing further intermediate models. The reminder is only
+    recomputed if one of its inputs changed.
+    """
+
+    candidate = todo.model_copy(update=updates)
+    if not _REMINDER_INPUT_FIELDS.isdisjoint(updates):
+        _apply_reminder(candidate, previous_reminder=todo.reminder_at)
+    _apply_auto_completion(candidate)
+    return candidate
 
 
 def _update_todo_at_index(todos: list[TodoItem], index: int, updated: TodoItem) -> None:
@@ -49,36 +113,46 @@ def _update_todo_at_index(todos: list[TodoItem], index: int, updated: TodoItem)
     save_todos(todos)
 
 
-def _process_completion(updated: TodoItem, *, was_completed: bool) -> None:
+def _process_completion(
+    updated: TodoItem,
+    *,
+    was_completed: bool,
+    todos: Optional[list[TodoItem]] = None,
+) -> None:
     if was_completed or not updated.completed or updated.completed_at is None:
         return
 
-    from gerris_erfolgs_tracker.gamification import update_gamification_on_completion
-    from gerris_erfolgs_tracker.kpis import update_kpis_on_completion
+    stats = kpis.update_kpis_on_completion(updated.completed_at)
+    gamification.update_gamification_on_completion(updated, stats)
+    _spawn_recurring_successor(updated, todos=todos)
 
-    stats = update_kpis_on_completion(updated.completed_at)
-    update_gamification_on_completion(updated, stats)
-    _spawn_recurring_successor(updated)
 
+def _spawn_recurring_successor(completed: TodoItem, *, todos: Optional[list[TodoItem]] = None) -> Optional[TodoItem]:
+    """Append the next occurrence of a recurring todo.
+
+    Callers that already hold the current todo list pass it as ``todos`` so it
+    is extended in place instead of being loaded from session state again.
+    """
 
-def _spawn_recurring_successor(completed: TodoItem) -> Optional[TodoItem]:
     if completed.recurrence is RecurrencePattern.ONCE:
         return None
 
     if completed.completed_at is None:
         return None
 
-    todos = get_todos()
+    if todos is None:
+        todos = get_todos()
     spawn_token = f"{completed.id}:{completed.completed_at.isoformat()}"
-    successor_id = uuid5(_RECURRENCE_SPAWN_NAMESPACE, spawn_token)
+    successor_id = str(uuid5(_RECURRENCE_SPAWN_NAMESPACE, spawn_token))
 
-    for existing in todos:
-        if str(successor_id) == existing.id:
-            return existing
+    existing_index = find_todo_index(successor_id)
+    if existing_index is not None and todos[existing_index].id == successor_id:
+        return todos[existing_index]
 
     advanced_due = _advance_due_date(completed.due_date, completed.recurrence)
+    # Source fields were validated with ``completed``; skip re-validating them.
     reset_milestones = [
-        Milestone(
+        Milestone.model_construct(
             title=milestone.title,
             points=milestone.points,
             complexity=milestone.complexity,
@@ -88,8 +162,8 @@ def _spawn_recurring_successor(completed: TodoItem) -> Optional[TodoItem]:
         for milestone in completed.milestones
     ]
 
-    successor = TodoItem(
-        id=str(successor_id),
+    successor = TodoItem.model_construct(
+        id=successor_id,
         title=completed.title,
         quadrant=completed.quadrant,
         due_date=advanced_due,
@@ -106,29 +180,40 @@ def _spawn_recurring_successor(completed: TodoItem) -> Optional[TodoItem]:
         milestones=reset_milestones,
     )
 
-    successor = _refresh_reminder(successor)
+    _apply_reminder(successor)
 
     todos.append(successor)
     save_todos(todos)
     return successor
 
 
-def _apply_auto_completion_if_ready(todos: list[TodoItem], index: int, *, previous_completed: bool) -> TodoItem:
-    todo = todos[index]
-    if (
-        todo.progress_target is not None
-        and todo.auto_done_when_target_reached
-        and todo.progress_current >= todo.progress_target
-        and not todo.completed
-    ):
-        todo = todo.model_copy(update={"completed": True, "completed_at": datetime.now(timezone.utc)})
-        todos[index] = todo
-
-    _update_todo_at_index(todos, index, todo)
-    _process_completion(todo, was_completed=previous_completed)
+def _commit_todo_at_index(todos: list[TodoItem], index: int, todo: TodoItem, *, previous_completed: bool) -> TodoItem:
+    with batch_saves():
+        _update_todo_at_index(todos, index, todo)
+        _process_completion(todo, was_completed=previous_completed, todos=todos)
     return todo
 
 
+def _mutate_todo(todo_id: str, mutator: Callable[[TodoItem], Optional[TodoItem]]) -> Optional[TodoItem]:
+    """Find a todo by id, apply ``mutator`` and persist the result.
+
+    ``mutator`` returns ``None`` to leave the todo untouched, in which case
+    nothing is saved and the stored todo is returned. Completion side effects
+    run if the mutation completes it.
+    """
+
+    todos: list[TodoItem] = get_todos()
+    index = find_todo_index(todo_id)
+    if index is None:
+        return None
+
+    todo = todos[index]
+    updated = mutator(todo)
+    if updated is None:
+        return todo
+    return _commit_todo_at_index(todos, index, updated, previous_completed=todo.completed)
+
+
 def _normalize_due_date(due_date: Optional[date | datetime]) -> Optional[datetime]:
     if due_date is None:
         return None
@@ -141,6 +226,7 @@ def _normalize_due_date(due_date: Optional[date | datetime]) -> Optional[datetim
     return datetime.combine(due_date, time.min, tzinfo=timezone.utc)
 
 
+@lru_cache(maxsize=1024)
 def _advance_due_date(current: Optional[datetime], recurrence: RecurrencePattern) -> Optional[datetime]:
     if current is None:
         return None
@@ -201,15 +287,13 @@ def add_todo(
         quadrant=ensure_quadrant(quadrant),
         due_date=_normalize_due_date(due_date),
         category=Category(category),
-        priority=int(priority),
+        priority=priority,
         description_md=description_md,
-        progress_current=float(progress_current),
-        progress_target=float(progress_target) if progress_target is not None else None,
+        progress_current=progress_current,
+        progress_target=progress_target,
         progress_unit=progress_unit,
         auto_done_when_target_reached=(
-            bool(auto_done_when_target_reached)
-            if auto_done_when_target_reached is not None
-            else progress_target is not None
+            auto_done_when_target_reached if auto_done_when_target_reached is not None else progress_target is not None
         ),
         completion_criteria_md=completion_criteria_md,
         recurrence=recurrence,
@@ -219,47 +303,34 @@ def add_todo(
     )
     payloads = list(attachment_payloads or [])
     if payloads:
-        stored = store_attachments(todo.id, payloads)
-        todo = todo.model_copy(update={"attachments": stored})
-    todo = _refresh_reminder(todo)
+        todo.attachments = store_attachments(todo.id, payloads)
+    return _append_todo(todos, todo)
+
+
+def _append_todo(todos: list[TodoItem], todo: TodoItem) -> TodoItem:
+    previous_completed = todo.completed
+    _apply_reminder(todo)
+    _apply_auto_completion(todo)
     todos.append(todo)
-    index = len(todos) - 1
-    return _apply_auto_completion_if_ready(todos, index, previous_completed=todo.completed)
+    return _commit_todo_at_index(todos, len(todos) - 1, todo, previous_completed=previous_completed)
 
 
 def toggle_complete(todo_id: str) -> Optional[TodoItem]:
-    todos: list[TodoItem] = get_todos()
-    updated: Optional[TodoItem] = None
-    was_completed = False
-    for index, todo in enumerate(todos):
-        if todo.id != todo_id:
-            continue
-
-        was_completed = todo.completed
+    def _toggle(todo: TodoItem) -> TodoItem:
         completed = not todo.completed
-        todos[index] = todo.model_copy(
-            update={
-                "completed": completed,
-                "completed_at": datetime.now(timezone.utc) if completed else None,
-            }
-        )
-        updated = todos[index]
-        break
+        return todo.model_copy(update={"completed": completed, "completed_at": _now() if completed else None})
 
-    if updated:
-        save_todos(todos)
-        if updated.completed and not was_completed:
-            _process_completion(updated, was_completed=was_completed)
-    return updated
+    return _mutate_todo(todo_id, _toggle)
 
 
 def delete_todo(todo_id: str) -> bool:
     todos: list[TodoItem] = get_todos()
-    remaining: list[TodoItem] = [todo for todo in todos if todo.id != todo_id]
-    if len(remaining) == len(todos):
+    index = find_todo_index(todo_id)
+    if index is None:
         return False
 
-    save_todos(remaining)
+    todos.pop(index)
+    save_todos(todos)
     return True
 
 
@@ -282,73 +353,71 @@ def update_todo(
     milestones: Optional[list[Milestone]] = None,
     attachments: Optional[list[AttachmentRef]] = None,
 ) -> Optional[TodoItem]:
-    todos: list[TodoItem] = get_todos()
-    updated: Optional[TodoItem] = None
-    for index, todo in enumerate(todos):
-        if todo.id != todo_id:
-            continue
-
-        updates: dict[str, object] = {}
-        if title is not None:
-            updates["title"] = title
-        if quadrant is not None:
-            updates["quadrant"] = ensure_quadrant(quadrant)
-        if due_date is not _UNSET:
-            assert due_date is None or isinstance(due_date, (date, datetime))
-            updates["due_date"] = _normalize_due_date(due_date)
-        if category is not None:
-            updates["category"] = Category(category)
-        if priority is not None:
-            updates["priority"] = int(priority)
-        if description_md is not None:
-            updates["description_md"] = description_md
-        if progress_current is not None:
-            updates["progress_current"] = float(progress_current)
-        if progress_target is not _UNSET:
-            assert progress_target is None or isinstance(progress_target, (int, float))
-            updates["progress_target"] = float(progress_target) if progress_target is not None else None
-        if progress_unit is not None:
-            updates["progress_unit"] = progress_unit
-        if auto_done_when_target_reached is not None:
-            updates["auto_done_when_target_reached"] = bool(auto_done_when_target_reached)
-        if completion_criteria_md is not None:
-            updates["completion_criteria_md"] = completion_criteria_md
-        if recurrence is not None:
-            updates["recurrence"] = recurrence
-        if email_reminder is not None:
-            updates["email_reminder"] = email_reminder
-        if milestones is not None:
-            updates["milestones"] = milestones
-        if attachments is not None:
-            updates["attachments"] = attachments
-
-        candidate = todo.model_copy(update=updates)
-        todos[index] = _refresh_reminder(candidate, previous=todo)
-        updated = _apply_auto_completion_if_ready(todos, index, previous_completed=todo.completed)
-        break
+    updates: dict[str, object] = {}
+    if title is not None:
+        updates["title"] = title
+    if quadrant is not None:
+        updates["quadrant"] = ensure_quadrant(quadrant)
+    if due_date is not _UNSET:
+        assert due_date is None or isinstance(due_date, (date, datetime))
+        updates["due_date"] = _normalize_due_date(due_date)
+    if category is not None:
+        updates["category"] = Category(category)
+    if priority is not None:
+        updates["priority"] = int(priority)
+    if description_md is not None:
+        updates["description_md"] = description_md
+    if progress_current is not None:
+        updates["progress_current"] = float(progress_current)
+    if progress_target is not _UNSET:
+        assert progress_target is None or isinstance(progress_target, (int, float))
+        updates["progress_target"] = float(progress_target) if progress_target is not None else None
+    if progress_unit is not None:
+        updates["progress_unit"] = progress_unit
+    if auto_done_when_target_reached is not None:
+        updates["auto_done_when_target_reached"] = bool(auto_done_when_target_reached)
+    if completion_criteria_md is not None:
+        updates["completion_criteria_md"] = completion_criteria_md
+    if recurrence is not None:
+        updates["recurrence"] = recurrence
+    if email_reminder is not None:
+        updates["email_reminder"] = email_reminder
+    if milestones is not None:
+        updates["milestones"] = milestones
+    if attachments is not None:
+        updates["attachments"] = attachments
+
+    def _apply(todo: TodoItem) -> Optional[TodoItem]:
+        changes = {field: value for field, value in updates.items() if getattr(todo, field) != value}
+        # An unchanged todo is only saved if it is due for auto-completion.
+        if not changes and not _reaches_auto_completion(todo):
+            return None
+        return _materialize_todo(todo, changes)
 
-    return updated
+    return _mutate_todo(todo_id, _apply)
 
 
 def duplicate_todo(todo_id: str) -> Optional[TodoItem]:
     todos: list[TodoItem] = get_todos()
-    for todo in todos:
-        if todo.id != todo_id:
-            continue
-
-        return add_todo(
-            title=todo.title,
-            quadrant=todo.quadrant,
-            due_date=todo.due_date,
-            category=todo.category,
-            priority=todo.priority,
-            description_md=todo.description_md,
-            recurrence=todo.recurrence,
-            email_reminder=todo.email_reminder,
-            milestones=todo.milestones,
-        )
+    index = find_todo_index(todo_id)
+    if index is None:
+        return None
 
-    return None
+    todo = todos[index]
+    # The source fields are already normalized, so build the copy directly and
+    # append it to the list loaded above instead of going through add_todo.
+    duplicate = TodoItem(
+        title=todo.title,
+        quadrant=todo.quadrant,
+        due_date=todo.due_date,
+        category=todo.category,
+        priority=todo.priority,
+        description_md=todo.description_md,
+        recurrence=todo.recurrence,
+        email_reminder=todo.email_reminder,
+        milestones=list(todo.milestones),
+    )
+    return _append_todo(todos, duplicate)
 
 
 def _update_milestones_for_todo(
@@ -356,20 +425,8 @@ def _update_milestones_for_todo(
     *,
     updater: Callable[[list[Milestone]], list[Milestone]],
 ) -> Optional[list[Milestone]]:
-    todos = get_todos()
-    updated_milestones: Optional[list[Milestone]] = None
-    for index, todo in enumerate(todos):
-        if todo.id != todo_id:
-            continue
-
-        current = list(todo.milestones)
-        new_values = updater(current)
-        todos[index] = todo.model_copy(update={"milestones": new_values})
-        _update_todo_at_index(todos, index, todos[index])
-        updated_milestones = new_values
-        break
-
-    return updated_milestones
+    updated = _mutate_todo(todo_id, lambda todo: todo.model_copy(update={"milestones": updater(list(todo.milestones))}))
+    return updated.milestones if updated is not None else None
 
 
 def add_milestone(
@@ -392,6 +449,40 @@ def add_milestone(
     return created
 
 
+def _update_milestone_at(
+    todo_id: str,
+    milestone_id: str,
+    *,
+    updater: Callable[[Milestone], Optional[Milestone]],
+) -> Optional[tuple[TodoItem, Milestone, Milestone]]:
+    """Replace a single milestone and persist only if ``updater`` changed it.
+
+    Returns the todo as it was before the update together with the previous and
+    the resulting milestone. ``updater`` returns ``None`` to signal "no change".
+    """
+
+    result: Optional[tuple[TodoItem, Milestone, Milestone]] = None
+
+    def _replace(todo: TodoItem) -> Optional[TodoItem]:
+        nonlocal result
+        position = next((position for position, item in enumerate(todo.milestones) if item.id == milestone_id), None)
+        if position is None:
+            return None
+
+        previous = todo.milestones[position]
+        updated = updater(previous)
+        result = (todo, previous, updated or previous)
+        if updated is None:
+            return None
+
+        milestones = list(todo.milestones)
+        milestones[position] = updated
+        return todo.model_copy(update={"milestones": milestones})
+
+    _mutate_todo(todo_id, _replace)
+    return result
+
+
 def update_milestone(
     todo_id: str,
     milestone_id: str,
@@ -402,181 +493,165 @@ def update_milestone(
     status: Optional[MilestoneStatus] = None,
     note: Optional[str] = None,
 ) -> Optional[Milestone]:
-    todos = get_todos()
-    previous_todo = next((item for item in todos if item.id == todo_id), None)
-    previous_lookup = {milestone.id: milestone for milestone in previous_todo.milestones} if previous_todo else {}
-
-    def _update(existing: list[Milestone]) -> list[Milestone]:
-        updated_items: list[Milestone] = []
-        for item in existing:
-            if item.id != milestone_id:
-                updated_items.append(item)
-                continue
-
-            updates: dict[str, object] = {}
-            if title is not None:
-                updates["title"] = title
-            if complexity is not None:
-                updates["complexity"] = complexity
-            if points is not None:
-                updates["points"] = points
-            if status is not None:
-                updates["status"] = status
-            if note is not None:
-                updates["note"] = note
-            updated_items.append(item.model_copy(update=updates))
-        return updated_items
-
-    updated_collection = _update_milestones_for_todo(todo_id, updater=_update)
-    if updated_collection is None:
+    updates = {
+        field: value
+        for field, value in (
+            ("title", title),
+            ("complexity", complexity),
+            ("points", points),
+            ("status", status),
+            ("note", note),
+        )
+        if value is not None
+    }
+
+    def _update(item: Milestone) -> Optional[Milestone]:
+        changes = {field: value for field, value in updates.items() if getattr(item, field) != value}
+        return item.model_copy(update=changes) if changes else None
+
+    result = _update_milestone_at(todo_id, milestone_id, updater=_update)
+    if result is None:
         return None
-    for item in updated_collection:
-        if item.id == milestone_id:
-            previous_state = previous_lookup.get(milestone_id)
-            if (
-                previous_state is not None
-                and previous_state.status is not MilestoneStatus.DONE
-                and item.status is MilestoneStatus.DONE
-                and previous_todo is not None
-            ):
-                award_milestone_points(todo=previous_todo, milestone=item)
-            return item
-    return None
-
-
-def move_milestone(todo_id: str, milestone_id: str, direction: Literal["left", "right"]) -> Optional[Milestone]:
-    status_order = list(MilestoneStatus)
-
-    def _move(existing: list[Milestone]) -> list[Milestone]:
-        updated_items: list[Milestone] = []
-        for item in existing:
-            if item.id != milestone_id:
-                updated_items.append(item)
-                continue
-
-            current_index = status_order.index(item.status)
-            new_index = current_index + (-1 if direction == "left" else 1)
-            if new_index < 0 or new_index >= len(status_order):
-                updated_items.append(item)
-                continue
-
-            new_status = status_order[new_index]
-            updated_items.append(item.model_copy(update={"status": new_status}))
-        return updated_items
-
-    updated_collection = _update_milestones_for_todo(todo_id, updater=_move)
-    if updated_collection is None:
+
+    previous_todo, previous_state, updated = result
+    if previous_state.status is not MilestoneStatus.DONE and updated.status is MilestoneStatus.DONE:
+        award_milestone_points(todo=previous_todo, milestone=updated)
+    return updated
+
+
+def set_milestone_status(todo_id: str, milestone_id: str, status: MilestoneStatus) -> Optional[Milestone]:
+    """Move a milestone on the board; unlike ``update_milestone`` this never awards points."""
+
+    def _move(item: Milestone) -> Optional[Milestone]:
+        if item.status is status:
+            return None
+        return item.model_copy(update={"status": status})
+
+    result = _update_milestone_at(todo_id, milestone_id, updater=_move)
+    if result is None:
         return None
-    for item in updated_collection:
-        if item.id == milestone_id:
-            return item
-    return None
+    return result[2]
 
 
 def add_kanban_card(todo_id: str, *, title: str, description_md: str = "") -> Optional[KanbanCard]:
-    todos: list[TodoItem] = get_todos()
-    for index, todo in enumerate(todos):
-        if todo.id != todo_id:
-            continue
-
+    def _add(todo: TodoItem) -> TodoItem:
         kanban = _ensure_kanban(todo)
-        card = KanbanCard(title=title, description_md=description_md, column_id=kanban.backlog_column_id())
-        updated_kanban = kanban.model_copy(update={"cards": [*kanban.cards, card]})
-        updated_todo = todo.model_copy(update={"kanban": updated_kanban})
-        _update_todo_at_index(todos, index, updated_todo)
-        return card
+        kanban.cards.append(
+            KanbanCard(title=title, description_md=description_md, column_id=kanban.backlog_column_id())
+        )
+        return todo.model_copy(update={"kanban": kanban})
 
-    return None
+    updated = _mutate_todo(todo_id, _add)
+    return updated.kanban.cards[-1] if updated is not None else None
 
 
-def move_kanban_card(
+def _move_card_to(
     todo_id: str,
-    *,
     card_id: str,
-    direction: Literal["left", "right"],
+    target_column_id: Callable[[TodoKanban, KanbanCard], Optional[str]],
 ) -> Optional[KanbanCard]:
-    todos: list[TodoItem] = get_todos()
-    for index, todo in enumerate(todos):
-        if todo.id != todo_id:
-            continue
+    moved: Optional[KanbanCard] = None
 
+    def _move(todo: TodoItem) -> Optional[TodoItem]:
+        nonlocal moved
         kanban = _ensure_kanban(todo)
-        ordered_columns = sorted(kanban.columns, key=lambda column: column.order)
-        column_ids = [column.id for column in ordered_columns]
 
-        card_lookup = {card.id: card for card in kanban.cards}
-        card = card_lookup.get(card_id)
-        if card is None:
+        card_position = kanban.card_position(card_id)
+        if card_position is None:
             return None
 
-        current_column_index = column_ids.index(card.column_id) if card.column_id in column_ids else 0
-        new_column_index = current_column_index + (-1 if direction == "left" else 1)
-        if new_column_index < 0 or new_column_index >= len(column_ids):
+        card = kanban.cards[card_position]
+        column_id = target_column_id(kanban, card)
+        if column_id is None or column_id == card.column_id:
             return None
 
-        target_column_id = column_ids[new_column_index]
         done_column_id = kanban.done_column_id()
-        updated_card = card.model_copy(
+        moved = card.model_copy(
             update={
-                "column_id": target_column_id,
-                "done_at": datetime.now(timezone.utc) if target_column_id == done_column_id else None,
+                "column_id": column_id,
+                "done_at": _now() if column_id == done_column_id else None,
             }
         )
-        updated_cards = [updated_card if existing.id == card_id else existing for existing in kanban.cards]
-        updated_kanban = kanban.model_copy(update={"cards": updated_cards})
-        updated_todo = todo.model_copy(update={"kanban": updated_kanban})
-        _update_todo_at_index(todos, index, updated_todo)
-        return updated_card
+        kanban.cards[card_position] = moved
+        return todo.model_copy(update={"kanban": kanban})
 
-    return None
+    _mutate_todo(todo_id, _move)
+    return moved
+
+
+def move_kanban_card(
+    todo_id: str,
+    *,
+    card_id: str,
+    direction: Literal["left", "right"],
+) -> Optional[KanbanCard]:
+    def _neighbour(kanban: TodoKanban, card: KanbanCard) -> Optional[str]:
+        ordered_column_ids = kanban.ordered_column_ids()
+        current_column_index = kanban.column_position(card.column_id) or 0
+        new_column_index = current_column_index + (-1 if direction == "left" else 1)
+        if new_column_index < 0 or new_column_index >= len(ordered_column_ids):
+            return None
+        return ordered_column_ids[new_column_index]
+
+    return _move_card_to(todo_id, card_id, _neighbour)
+
+
+def set_kanban_card_column(todo_id: str, *, card_id: str, column_id: str) -> Optional[KanbanCard]:
+    """Move a card straight into ``column_id``; unknown columns are ignored."""
+
+    def _target(kanban: TodoKanban, card: KanbanCard) -> Optional[str]:
+        return column_id if kanban.column_position(column_id) is not None else None
+
+    return _move_card_to(todo_id, card_id, _target)
 
 
 def update_todo_progress(todo: TodoItem, *, delta: float, source_event_id: str) -> Optional[TodoItem]:
     todos: list[TodoItem] = get_todos()
-    for index, existing in enumerate(todos):
-        if existing.id != todo.id:
-            continue
+    index = find_todo_index(todo.id)
+    if index is None:
+        return None
 
-        if source_event_id in existing.processed_progress_events:
-            return existing
+    existing = todos[index]
+    # A zero delta still records the event and can complete a todo already at its target.
+    if existing.has_processed_progress_event(source_event_id):
+        return existing
 
-        previous_progress = existing.progress_current
-        updated_progress = existing.progress_current + float(delta)
-        updated_events = cap_list_tail(
-            [*existing.processed_progress_events, source_event_id], PROCESSED_PROGRESS_EVENTS_LIMIT
-        )
-        updates: dict[str, object] = {
-            "progress_current": updated_progress,
-            "processed_progress_events": updated_events,
-        }
-
-        was_completed = existing.completed
-        should_complete = (
-            existing.progress_target is not None
-            and existing.auto_done_when_target_reached
-            and updated_progress >= existing.progress_target
-            and not existing.completed
+    previous_progress = existing.progress_current
+    updated_progress = existing.progress_current + delta
+    # Copy once: ``existing`` is shared with the cached todo models.
+    updated_events = append_capped(
+        list(existing.processed_progress_events), source_event_id, PROCESSED_PROGRESS_EVENTS_LIMIT
+    )
+    updates: dict[str, object] = {
+        "progress_current": updated_progress,
+        "processed_progress_events": updated_events,
+    }
+
+    was_completed = existing.completed
+    should_complete = (
+        existing.progress_target is not None
+        and existing.auto_done_when_target_reached
+        and updated_progress >= existing.progress_target
+        and not existing.completed
+    )
+    if should_complete:
+        updates.update(
+            {
+                "completed": True,
+                "completed_at": _now(),
+            }
         )
-        if should_complete:
-            updates.update(
-                {
-                    "completed": True,
-                    "completed_at": datetime.now(timezone.utc),
-                }
-            )
-
-        todos[index] = existing.model_copy(update=updates)
-        updated = todos[index]
+
+    updated = existing.model_copy(update=updates)
+    with batch_saves():
         _update_todo_at_index(todos, index, updated)
         award_progress_points(
             todo=updated,
             previous_progress=previous_progress,
             updated_progress=updated_progress,
         )
-        _process_completion(updated, was_completed=was_completed)
-        return updated
-
-    return None
+        _process_completion(updated, was_completed=was_completed, todos=todos)
+    return updated
 
 
 __all__ = [
@@ -587,8 +662,10 @@ __all__ = [
     "update_todo",
     "add_kanban_card",
     "move_kanban_card",
+    "set_kanban_card_column",
     "update_todo_progress",
+    "frozen_now",
     "add_milestone",
     "update_milestone",
-    "move_milestone",
+    "set_milestone_status",
 ]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import streamlit as st
-from openai import OpenAI
 
 from gerris_erfolgs_tracker.ai_features import suggest_email_draft
 from gerris_erfolgs_tracker.constants import (
@@ -23,6 +24,9 @@ from gerris_erfolgs_tracker.constants import (
 from gerris_erfolgs_tracker.i18n import translate_text
 from gerris_erfolgs_tracker.llm_schemas import EmailDraft
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 EMAIL_TONE_OPTIONS: tuple[tuple[str, tuple[str, str]], ...] = (
     ("friendly", ("Freundlich", "Friendly")),
     ("formal", ("Formell", "Formal")),
@@ -41,6 +45,21 @@ EMAIL_LANGUAGE_OPTIONS: tuple[tuple[str, tuple[str, str]], ...] = (
     ("en", ("Englisch", "English")),
 )
 
+# Option values for the selectboxes, derived once instead of per render.
+EMAIL_TONE_VALUES: tuple[str, ...] = tuple(value for value, _ in EMAIL_TONE_OPTIONS)
+EMAIL_LENGTH_VALUES: tuple[str, ...] = tuple(value for value, _ in EMAIL_LENGTH_OPTIONS)
+EMAIL_LANGUAGE_VALUES: tuple[str, ...] = tuple(value for value, _ in EMAIL_LANGUAGE_OPTIONS)
+
+# (suggest_email_draft argument, session state key, default) for the draft form.
+_EMAIL_REQUEST_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("title", NEW_EMAIL_TITLE_KEY, ""),
+    ("context", NEW_EMAIL_CONTEXT_KEY, ""),
+    ("recipient", NEW_EMAIL_RECIPIENT_KEY, ""),
+    ("tone", NEW_EMAIL_TONE_KEY, EMAIL_TONE_VALUES[0]),
+    ("length", NEW_EMAIL_LENGTH_KEY, EMAIL_LENGTH_VALUES[1]),
+    ("language", NEW_EMAIL_LANGUAGE_KEY, EMAIL_LANGUAGE_VALUES[0]),
+)
+
 
 def _reset_email_state() -> None:
     for cleanup_key in (
@@ -57,41 +76,57 @@ def _reset_email_state() -> None:
         st.session_state.pop(cleanup_key, None)
 
 
+@lru_cache(maxsize=8)
+def _option_labels(options: tuple[tuple[str, tuple[str, str]], ...]) -> dict[str, str]:
+    return {option_value: translate_text(label) for option_value, label in options}
+
+
 def _option_label(value: str, options: tuple[tuple[str, tuple[str, str]], ...]) -> str:
-    for option_value, label in options:
-        if option_value == value:
-            return translate_text(label)
-    return str(value)
+    return _option_labels(options).get(value, str(value))
+
+
+@dataclass(frozen=True)
+class _EmailOutputStrings:
+    subject_prefix: str
+    recipient_prefix: str
+    recipient_missing: str
+    salutation: str
+    closing: str
+    signature: str
+    empty_body: str
+    empty_subject: str
+
+
+# The draft template wording is fixed, so it is translated once at import.
+_EMAIL_OUTPUT_STRINGS = _EmailOutputStrings(
+    subject_prefix=translate_text(("Betreff", "Subject")),
+    recipient_prefix=translate_text(("Empfänger", "Recipient")),
+    recipient_missing=translate_text(("Nicht angegeben", "Not specified")),
+    salutation=f"{translate_text(('Hallo', 'Hello'))},",
+    closing=translate_text(("Viele Grüße", "Best regards")),
+    signature=translate_text(("Dein Name", "Your name")),
+    empty_body=translate_text(("Kein Inhalt.", "No content.")),
+    empty_subject=translate_text(("Ohne Betreff", "No subject")),
+)
 
 
 def _format_email_output(*, draft: EmailDraft, recipient: str) -> str:
-    subject_prefix = translate_text(("Betreff", "Subject"))
-    recipient_prefix = translate_text(("Empfänger", "Recipient"))
-    recipient_line = (
-        f"{recipient_prefix}: {recipient}"
-        if recipient.strip()
-        else f"{recipient_prefix}: {translate_text(('Nicht angegeben', 'Not specified'))}"
-    )
-    salutation = draft.salutation or f"{translate_text(('Hallo', 'Hello'))},"
-    closing = draft.closing or translate_text(("Viele Grüße", "Best regards"))
-    signature = translate_text(("Dein Name", "Your name"))
-    body_md = draft.body_md.strip() or translate_text(("Kein Inhalt.", "No content."))
-
-    return "\n".join(
-        (
-            f"{subject_prefix}: {draft.subject.strip() or translate_text(('Ohne Betreff', 'No subject'))}",
-            recipient_line,
-            "",
-            salutation,
-            "",
-            body_md,
-            "",
-            f"{closing},",
-            signature,
-        )
+    strings = _EMAIL_OUTPUT_STRINGS
+    recipient_line = f"{strings.recipient_prefix}: {recipient if recipient.strip() else strings.recipient_missing}"
+    salutation = draft.salutation or strings.salutation
+    closing = draft.closing or strings.closing
+    body_md = draft.body_md.strip() or strings.empty_body
+
+    return (
+        f"{strings.subject_prefix}: {draft.subject.strip() or strings.empty_subject}\n"
+        f"{recipient_line}\n\n{salutation}\n\n{body_md}\n\n{closing},\n{strings.signature}"
     )
 
 
+# Runs as a fragment: widget interactions (Create, Reset) only rerun the email
+# page instead of the whole app. Email draft state is not persisted, so the
+# fragment does not need the app-level save batching.
+@st.fragment
 def render_emails_page(*, ai_enabled: bool, client: Optional[OpenAI]) -> None:  # noqa: ARG001
     if st.session_state.pop(NEW_EMAIL_RESET_TRIGGER_KEY, False):
         _reset_email_state()
@@ -99,9 +134,9 @@ def render_emails_page(*, ai_enabled: bool, client: Optional[OpenAI]) -> None:
     st.session_state.setdefault(NEW_EMAIL_TITLE_KEY, "")
     st.session_state.setdefault(NEW_EMAIL_CONTEXT_KEY, "")
     st.session_state.setdefault(NEW_EMAIL_RECIPIENT_KEY, "")
-    st.session_state.setdefault(NEW_EMAIL_TONE_KEY, EMAIL_TONE_OPTIONS[0][0])
-    st.session_state.setdefault(NEW_EMAIL_LENGTH_KEY, EMAIL_LENGTH_OPTIONS[1][0])
-    st.session_state.setdefault(NEW_EMAIL_LANGUAGE_KEY, EMAIL_LANGUAGE_OPTIONS[0][0])
+    st.session_state.setdefault(NEW_EMAIL_TONE_KEY, EMAIL_TONE_VALUES[0])
+    st.session_state.setdefault(NEW_EMAIL_LENGTH_KEY, EMAIL_LENGTH_VALUES[1])
+    st.session_state.setdefault(NEW_EMAIL_LANGUAGE_KEY, EMAIL_LANGUAGE_VALUES[0])
     st.session_state.setdefault(NEW_EMAIL_OUTPUT_KEY, "")
     st.session_state.setdefault(NEW_EMAIL_DRAFT_META_KEY, {})
     st.session_state.setdefault(NEW_EMAIL_FROM_AI_KEY, False)
@@ -150,21 +185,21 @@ def render_emails_page(*, ai_enabled: bool, client: Optional[OpenAI]) -> None:
             with meta_col:
                 st.selectbox(
                     translate_text(("Ton", "Tone")),
-                    options=[option for option, _ in EMAIL_TONE_OPTIONS],
+                    options=EMAIL_TONE_VALUES,
                     key=NEW_EMAIL_TONE_KEY,
                     format_func=lambda option: _option_label(option, EMAIL_TONE_OPTIONS),
                     help=translate_text(("Lege die Tonalität der E-Mail fest.", "Set the tone for the email draft.")),
                 )
                 st.selectbox(
                     translate_text(("Länge", "Length")),
-                    options=[option for option, _ in EMAIL_LENGTH_OPTIONS],
+                    options=EMAIL_LENGTH_VALUES,
                     key=NEW_EMAIL_LENGTH_KEY,
                     format_func=lambda option: _option_label(option, EMAIL_LENGTH_OPTIONS),
                     help=translate_text(("Wähle eine gewünschte Länge.", "Pick the desired length.")),
                 )
                 st.selectbox(
                     translate_text(("Sprache", "Language")),
-                    options=[option for option, _ in EMAIL_LANGUAGE_OPTIONS],
+                    options=EMAIL_LANGUAGE_VALUES,
                     key=NEW_EMAIL_LANGUAGE_KEY,
                     format_func=lambda option: _option_label(option, EMAIL_LANGUAGE_OPTIONS),
                     help=translate_text(("Wähle die Ausgabesprache.", "Choose the output language.")),
@@ -175,18 +210,11 @@ def render_emails_page(*, ai_enabled: bool, client: Optional[OpenAI]) -> None:
                 type="primary",
             )
             if submit:
-                recipient = str(st.session_state.get(NEW_EMAIL_RECIPIENT_KEY, ""))
-                suggestion = suggest_email_draft(
-                    title=str(st.session_state.get(NEW_EMAIL_TITLE_KEY, "")),
-                    context=str(st.session_state.get(NEW_EMAIL_CONTEXT_KEY, "")),
-                    recipient=recipient,
-                    tone=str(st.session_state.get(NEW_EMAIL_TONE_KEY, EMAIL_TONE_OPTIONS[0][0])),
-                    length=str(st.session_state.get(NEW_EMAIL_LENGTH_KEY, EMAIL_LENGTH_OPTIONS[1][0])),
-                    language=str(st.session_state.get(NEW_EMAIL_LANGUAGE_KEY, EMAIL_LANGUAGE_OPTIONS[0][0])),
-                    client=client if ai_enabled else None,
-                )
+                session_state = st.session_state
+                request = {field: str(session_state.get(key, default)) for field, key, default in _EMAIL_REQUEST_FIELDS}
+                suggestion = suggest_email_draft(**request, client=client if ai_enabled else None)
                 draft = suggestion.payload
-                output = _format_email_output(draft=draft, recipient=recipient)
+                output = _format_email_output(draft=draft, recipient=request["recipient"])
                 st.session_state[NEW_EMAIL_OUTPUT_KEY] = output
                 st.session_state[NEW_EMAIL_FROM_AI_KEY] = suggestion.from_ai
                 st.session_state[NEW_EMAIL_DRAFT_META_KEY] = {
@@ -276,7 +304,7 @@ def render_emails_page(*, ai_enabled: bool, client: Optional[OpenAI]) -> None:
                 type="secondary",
             ):
                 st.session_state[NEW_EMAIL_RESET_TRIGGER_KEY] = True
-                st.rerun()
+                st.rerun(scope="fragment")
 
         st.caption(
             translate_text(
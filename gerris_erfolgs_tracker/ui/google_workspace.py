@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import json
 import os
+import random
+import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Callable, Sequence, TypeVar
-from urllib.parse import parse_qs, urlparse
+from functools import lru_cache, partial
+from html import escape
+from itertools import cycle
+from typing import Callable, Final, Sequence, TypedDict, TypeVar
+from urllib.parse import unquote_plus
+from uuid import uuid4
 
 import streamlit as st
 from streamlit.errors import StreamlitSecretNotFoundError
@@ -14,6 +21,7 @@ from gerris_erfolgs_tracker.i18n import translate_text
 from gerris_erfolgs_tracker.integrations.google import OAuthFlowError, get_default_token_store, get_tasks_service
 from gerris_erfolgs_tracker.integrations.google.client import GoogleApiError
 from gerris_erfolgs_tracker.integrations.google.models import TaskItem, TaskList
+from gerris_erfolgs_tracker.integrations.google.services import GoogleService
 from gerris_erfolgs_tracker.integrations.google.tasks_service import create_task, list_task_lists, list_tasks
 
 GOOGLE_CONNECTED_EMAIL_KEY = "google_connected_email"
@@ -21,27 +29,35 @@ TASKLISTS_STATE_KEY = "workspace_tasks_tasklists"
 TASKS_STATE_KEY = "workspace_tasks_items"
 TASKS_ERROR_STATE_KEY = "workspace_tasks_error"
 TASKS_SELECTED_LIST_KEY = "workspace_tasks_selected_list"
+TASKS_CACHE_VERSION_KEY = "workspace_tasks_cache_version"
+TASKS_SERVICE_STATE_KEY = "workspace_tasks_service"
+TASKS_PREFETCH_STATE_KEY = "workspace_tasks_prefetch"
+TASKS_PREFETCH_LIMIT = 5
+TASKS_CACHE_TTL_SECONDS = 60
 
 
 def _get_secret(name: str) -> str | None:
     try:
         value = st.secrets.get(name)
-        if value:
-            return str(value)
     except StreamlitSecretNotFoundError:
         value = None
+    if value:
+        return str(value)
     return os.getenv(name)
 
 
+_CALENDAR_SRC_PARAM_RE = re.compile(r"[?&](src|cid)=([^&#]+)")
+
+
+@lru_cache(maxsize=32)
 def _extract_calendar_src(value: str) -> str:
     cleaned = value.strip()
     if "://" not in cleaned:
         return cleaned
-    parsed = urlparse(cleaned)
-    query = parse_qs(parsed.query)
+    params = dict(reversed(_CALENDAR_SRC_PARAM_RE.findall(cleaned)))
     for key in ("src", "cid"):
-        if key in query and query[key]:
-            return query[key][0]
+        if key in params:
+            return unquote_plus(params[key])
     return cleaned
 
 
@@ -53,34 +69,30 @@ def _calendar_src_from_env(*, keys: Sequence[str], fallback: str | None = None)
     return fallback
 
 
-def _load_calendar_configs() -> list[tuple[str, str]]:
-    raw = _get_secret("GOOGLE_CALENDARS_JSON")
-    if not raw:
-        return []
+CalendarConfigs = tuple[tuple[str, str], ...]
+
+
+@lru_cache(maxsize=4)
+def _parse_calendar_configs(raw: str) -> tuple[CalendarConfigs, tuple[str, str] | None]:
+    """Parse ``GOOGLE_CALENDARS_JSON`` into ``(name, src)`` pairs plus an optional warning.
+
+    The secret does not change between reruns, so the result is cached per raw
+    value; the caller shows the warning on every run.
+    """
 
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError:
-        st.warning(
-            translate_text(
-                (
-                    "GOOGLE_CALENDARS_JSON ist kein gültiges JSON. Es werden die einzelnen Kalender-ENV-Variablen genutzt.",
-                    "GOOGLE_CALENDARS_JSON is not valid JSON. Falling back to the individual calendar env vars.",
-                )
-            )
+        return (), (
+            "GOOGLE_CALENDARS_JSON ist kein gültiges JSON. Es werden die einzelnen Kalender-ENV-Variablen genutzt.",
+            "GOOGLE_CALENDARS_JSON is not valid JSON. Falling back to the individual calendar env vars.",
         )
-        return []
 
     if not isinstance(payload, list):
-        st.warning(
-            translate_text(
-                (
-                    "GOOGLE_CALENDARS_JSON muss eine Liste von Kalender-Objekten sein.",
-                    "GOOGLE_CALENDARS_JSON must be a list of calendar objects.",
-                )
-            )
+        return (), (
+            "GOOGLE_CALENDARS_JSON muss eine Liste von Kalender-Objekten sein.",
+            "GOOGLE_CALENDARS_JSON must be a list of calendar objects.",
         )
-        return []
 
     configs: list[tuple[str, str]] = []
     for item in payload:
@@ -100,23 +112,55 @@ def _load_calendar_configs() -> list[tuple[str, str]]:
         configs.append((name_value.strip(), _extract_calendar_src(calendar_value)))
 
     if not configs:
-        st.warning(
-            translate_text(
-                (
-                    "GOOGLE_CALENDARS_JSON enthält keine gültigen Kalender.",
-                    "GOOGLE_CALENDARS_JSON does not contain any valid calendars.",
-                )
-            )
+        return (), (
+            "GOOGLE_CALENDARS_JSON enthält keine gültigen Kalender.",
+            "GOOGLE_CALENDARS_JSON does not contain any valid calendars.",
         )
 
-    return configs
+    return tuple(configs), None
 
 
-def _render_calendar_iframe(*, calendar_src: str, color: str) -> None:
-    iframe = f"""
-    <iframe src="https://calendar.google.com/calendar/embed?height=600&wkst=1&ctz=Europe%2FAmsterdam&showPrint=0&src={calendar_src}&color={color}" style="border:solid 1px #777" width="100%" height="600" frameborder="0" scrolling="no"></iframe>
-    """
-    st.markdown(iframe, unsafe_allow_html=True)
+def _load_calendar_configs() -> list[tuple[str, str]]:
+    raw = _get_secret("GOOGLE_CALENDARS_JSON")
+    if not raw:
+        return []
+
+    configs, warning = _parse_calendar_configs(raw)
+    if warning is not None:
+        st.warning(translate_text(warning))
+    return list(configs)
+
+
+_CALENDAR_IFRAME_TEMPLATE = (
+    '<iframe src="https://calendar.google.com/calendar/embed?height=600&wkst=1&ctz=Europe%2FAmsterdam'
+    '&showPrint=0&src={src}&color={color}" style="border:solid 1px #777" width="100%" height="600" '
+    'frameborder="0" scrolling="no"></iframe>'
+)
+
+
+_CALENDAR_COLORS: tuple[str, ...] = (
+    "%23616161",
+    "%237986cb",
+    "%23b874d9",
+    "%2376a73e",
+    "%23c95f2a",
+)
+
+
+_CALENDAR_GRID_TEMPLATE = (
+    '<div style="display:grid;grid-template-columns:repeat({columns}, minmax(0, 1fr));gap:1rem">{cells}</div>'
+)
+
+
+@lru_cache(maxsize=8)
+def _calendar_grid_html(cells: tuple[tuple[str, str, str], ...]) -> str:
+    """Lay out all calendars as one HTML grid with up to two columns per row."""
+
+    rendered = "".join(
+        f"<div><p><strong>{escape(heading)}</strong></p>{_CALENDAR_IFRAME_TEMPLATE.format(src=src, color=color)}</div>"
+        for heading, src, color in cells
+    )
+    return _CALENDAR_GRID_TEMPLATE.format(columns=min(2, len(cells)), cells=rendered)
 
 
 def render_shared_calendar_header() -> None:
@@ -130,25 +174,18 @@ def render_shared_calendar_header() -> None:
     )
 
 
-def render_shared_calendar() -> None:
+def _calendar_cells() -> tuple[list[tuple[str, str, str]], str | None]:
+    """Return ``(heading, src, color)`` for every calendar to show plus an optional hint.
+
+    ``GOOGLE_CALENDARS_JSON`` wins; otherwise the shared and Gerri calendars are
+    read from the individual secrets/env vars.
+    """
+
     calendar_configs = _load_calendar_configs()
     if calendar_configs:
-        colors = [
-            "%23616161",
-            "%237986cb",
-            "%23b874d9",
-            "%2376a73e",
-            "%23c95f2a",
-        ]
-        for row_start in range(0, len(calendar_configs), 2):
-            row = calendar_configs[row_start : row_start + 2]
-            columns = st.columns(len(row))
-            for offset, (name, src) in enumerate(row):
-                with columns[offset]:
-                    st.markdown(translate_text((f"**{name}**", f"**{name}**")))
-                    color = colors[(row_start + offset) % len(colors)]
-                    _render_calendar_iframe(calendar_src=src, color=color)
-        return
+        return [
+            (name, src, color) for (name, src), color in zip(calendar_configs, cycle(_CALENDAR_COLORS), strict=False)
+        ], None
 
     shared_calendar_src = _calendar_src_from_env(
         keys=(
@@ -158,6 +195,16 @@ def render_shared_calendar() -> None:
         ),
         fallback="e2a52f862c8088c82d9f74825b8c39f6069965fdc652472fbf5ec28e891c077e@group.calendar.google.com",
     )
+    if not shared_calendar_src:
+        return [], None
+
+    cells = [
+        (
+            translate_text(("Gemeinsamer Kalender / 2025", "Shared calendar / 2025")),
+            shared_calendar_src,
+            _CALENDAR_COLORS[0],
+        )
+    ]
     gerri_calendar_src = _calendar_src_from_env(
         keys=(
             "KalenderGerri",
@@ -165,8 +212,21 @@ def render_shared_calendar() -> None:
             "KALENDER_GERRI",
         )
     )
+    if not gerri_calendar_src:
+        return cells, translate_text(
+            (
+                "Kalender Gerri ist noch nicht hinterlegt. Setze `KalenderGerri` (oder `CALENDAR_GERRI`) in deinen Secrets oder der Umgebung, um ihn neben dem geteilten Kalender anzuzeigen.",
+                "Gerri calendar is not configured yet. Set `KalenderGerri` (or `CALENDAR_GERRI`) in your secrets or environment to show it next to the shared calendar.",
+            )
+        )
 
-    if not shared_calendar_src:
+    cells.append((translate_text(("Kalender Gerri", "Gerri calendar")), gerri_calendar_src, _CALENDAR_COLORS[1]))
+    return cells, None
+
+
+def render_shared_calendar() -> None:
+    cells, hint = _calendar_cells()
+    if not cells:
         st.warning(
             translate_text(
                 (
@@ -177,65 +237,163 @@ def render_shared_calendar() -> None:
         )
         return
 
-    if gerri_calendar_src:
-        shared_column, gerri_column = st.columns(2)
-        with shared_column:
-            st.markdown(
-                translate_text(
-                    (
-                        "**Gemeinsamer Kalender / 2025**",
-                        "**Shared calendar / 2025**",
-                    )
-                )
-            )
-            _render_calendar_iframe(calendar_src=shared_calendar_src, color="%23616161")
-        with gerri_column:
-            st.markdown(translate_text(("**Kalender Gerri**", "**Gerri calendar**")))
-            _render_calendar_iframe(calendar_src=gerri_calendar_src, color="%237986cb")
-        return
+    if hint:
+        st.markdown(hint)
+    # One element for all calendars instead of columns plus a heading and an iframe per cell.
+    st.markdown(_calendar_grid_html(tuple(cells)), unsafe_allow_html=True)
 
-    st.markdown(
-        translate_text(
-            (
-                "Kalender Gerri ist noch nicht hinterlegt. Setze `KalenderGerri` (oder `CALENDAR_GERRI`) in deinen Secrets oder der Umgebung, um ihn neben dem geteilten Kalender anzuzeigen.",
-                "Gerri calendar is not configured yet. Set `KalenderGerri` (or `CALENDAR_GERRI`) in your secrets or environment to show it next to the shared calendar.",
-            )
-        )
-    )
-    _render_calendar_iframe(calendar_src=shared_calendar_src, color="%23616161")
+
+_NOT_REFRESHED_CAPTION: Final[str] = translate_text(("Noch nicht aktualisiert", "Not refreshed yet"))
 
 
 def _refresh_timestamp(service_key: str) -> str:
+    """Record a refresh and store the ready-made caption shown under the panel header."""
+
     now = datetime.now(timezone.utc)
     timestamp = now.strftime("%Y-%m-%d %H:%M UTC")
-    st.session_state[f"workspace_refresh_{service_key}"] = timestamp
+    # Separate key: ``workspace_refresh_<service>`` belongs to the Refresh button itself.
+    st.session_state[f"workspace_refresh_caption_{service_key}"] = translate_text(
+        (
+            f"Zuletzt aktualisiert: {timestamp}",
+            f"Last refreshed: {timestamp}",
+        )
+    )
     return timestamp
 
 
-def _get_last_refresh(service_key: str) -> str | None:
-    value = st.session_state.get(f"workspace_refresh_{service_key}")
+def _last_refresh_caption(service_key: str) -> str:
+    value = st.session_state.get(f"workspace_refresh_caption_{service_key}")
     if isinstance(value, str):
         return value
-    return None
+    return _NOT_REFRESHED_CAPTION
 
 
 T = TypeVar("T")
 
 
-def _with_backoff(action: Callable[[], T], *, retries: int = 3, base_delay: float = 0.5) -> T:
-    last_error: Exception | None = None
-    for attempt in range(retries):
+def _with_backoff(
+    action: Callable[[], T],
+    *,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    retry_on: tuple[type[Exception], ...] = (GoogleApiError, TimeoutError, ConnectionError),
+) -> T:
+    """Run ``action`` and retry transient failures with capped, jittered exponential backoff.
+
+    Exceptions outside ``retry_on`` propagate immediately, as do Google API
+    errors that will not go away on a retry (e.g. 400, 401, 403, 404).
+    """
+
+    for attempt in range(retries - 1):
         try:
             return action()
-        except Exception as exc:
-            last_error = exc
-            if attempt < retries - 1:
-                time.sleep(base_delay * (2**attempt))
-    if last_error:
-        raise last_error
-    raise RuntimeError("Failed without error context.")
+        except retry_on as exc:
+            if isinstance(exc, GoogleApiError) and not exc.retriable:
+                raise
+            # Jitter keeps parallel sessions from hitting Google at the same moment.
+            time.sleep(min(max_delay, base_delay * (2**attempt)) * (1 + random.random() * 0.5))
+    return action()
+
+
+def _tasks_cache_version(*, bump: bool = False) -> str:
+    # st.cache_data is shared by all sessions, so a bump needs a token no other
+    # session has used; a per-session counter would land on their cached keys.
+    version = st.session_state.get(TASKS_CACHE_VERSION_KEY, "")
+    if not isinstance(version, str):
+        version = ""
+    if bump:
+        version = uuid4().hex
+        st.session_state[TASKS_CACHE_VERSION_KEY] = version
+    return version
+
+
+def _get_tasks_service_for(email: str) -> GoogleService | None:
+    """Return the Tasks service for ``email``, reusing the session's copy until its token expires.
+
+    Returns ``None`` when no token is stored; raises ``OAuthFlowError`` when the
+    token cannot be refreshed. Callers drop the cached copy when a request fails
+    so a revoked token is not reused on the next run.
+    """
+
+    now = datetime.now(timezone.utc)
+    cached = st.session_state.get(TASKS_SERVICE_STATE_KEY)
+    if isinstance(cached, tuple) and len(cached) == 3:
+        cached_email, expires_at, service = cached
+        if cached_email == email and (expires_at is None or expires_at > now):
+            return service
+
+    st.session_state.pop(TASKS_SERVICE_STATE_KEY, None)
+    token_store = get_default_token_store()
+    token = token_store.load_token(email)
+    if token is None:
+        return None
+    service = get_tasks_service(email, token_store)
+    if token.is_expired(now=now):
+        # get_tasks_service refreshed the token; keep the new expiry.
+        token = token_store.load_token(email) or token
+    st.session_state[TASKS_SERVICE_STATE_KEY] = (email, token.expires_at, service)
+    return service
+
+
+@st.cache_data(ttl=TASKS_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_list_task_lists(email: str, cache_version: str, *, _service: GoogleService) -> list[TaskList]:
+    """Fetch the task lists of ``email``; ``cache_version`` is bumped to force a reload."""
+
+    return list_task_lists(_service, max_results=50)
+
+
+@st.cache_data(ttl=TASKS_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_list_tasks(email: str, tasklist_id: str, cache_version: str, *, _service: GoogleService) -> list[TaskItem]:
+    return list_tasks(_service, tasklist_id=tasklist_id, max_results=20)
+
+
+@lru_cache(maxsize=1)
+def _prefetch_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="workspace-tasks-prefetch")
+
+
+def _prefetch_other_task_lists(
+    service: GoogleService, tasklists: Sequence[TaskList], *, selected_id: str, cache_version: str
+) -> None:
+    """Start loading the tasks of a few other lists so switching to them does not wait on Google."""
+
+    executor = _prefetch_executor()
+    submitted_at = time.monotonic()
+    other_ids = [task_list.list_id for task_list in tasklists if task_list.list_id != selected_id]
+    st.session_state[TASKS_PREFETCH_STATE_KEY] = {
+        list_id: (
+            submitted_at,
+            cache_version,
+            executor.submit(_with_backoff, partial(list_tasks, service, tasklist_id=list_id, max_results=20)),
+        )
+        for list_id in other_ids[:TASKS_PREFETCH_LIMIT]
+    }
+
 
+def _take_prefetched_tasks(list_id: str, *, cache_version: str) -> list[TaskItem] | None:
+    """Return prefetched tasks for ``list_id`` if they arrived without error; each result is used once.
 
+    Results older than the listing cache TTL or from an earlier ``cache_version``
+    are dropped, so a prefetch never serves data the cache would have expired.
+    """
+
+    prefetched = st.session_state.get(TASKS_PREFETCH_STATE_KEY)
+    if not isinstance(prefetched, dict):
+        return None
+    entry = prefetched.pop(list_id, None)
+    if not isinstance(entry, tuple) or len(entry) != 3:
+        return None
+    submitted_at, entry_version, future = entry
+    if entry_version != cache_version or time.monotonic() - submitted_at > TASKS_CACHE_TTL_SECONDS:
+        return None
+    if not isinstance(future, Future) or not future.done() or future.exception() is not None:
+        return None
+    return future.result()
+
+
+# Fragment as well: a sample section's Refresh button only redraws that section.
+@st.fragment
 def _render_service_section(
     *,
     service_key: str,
@@ -246,8 +404,8 @@ def _render_service_section(
     panel = st.container(border=True)
     header_cols = panel.columns([0.75, 0.25])
     with header_cols[0]:
-        panel.subheader(translate_text(title))
-        panel.write(translate_text(description))
+        # Heading and description are static text, so send them as one markdown element.
+        panel.markdown(f"### {translate_text(title)}\n\n{translate_text(description)}")
     with header_cols[1]:
         if panel.button(
             translate_text(("Aktualisieren", "Refresh")),
@@ -256,18 +414,7 @@ def _render_service_section(
         ):
             _refresh_timestamp(service_key)
 
-    last_refresh = _get_last_refresh(service_key)
-    if last_refresh:
-        panel.caption(
-            translate_text(
-                (
-                    f"Zuletzt aktualisiert: {last_refresh}",
-                    f"Last refreshed: {last_refresh}",
-                )
-            )
-        )
-    else:
-        panel.caption(translate_text(("Noch nicht aktualisiert", "Not refreshed yet")))
+    panel.caption(_last_refresh_caption(service_key))
 
     if items:
         panel.markdown("\n".join(f"- {item}" for item in items))
@@ -282,14 +429,21 @@ def _get_connected_email() -> str | None:
     return None
 
 
+_UNTITLED_TASK_LABEL: Final[str] = translate_text(("Ohne Titel", "Untitled"))
+_TASK_DUE_TEMPLATE: Final[str] = translate_text(("{title} · Fällig {due}", "{title} · Due {due}"))
+
+
 def _format_task_item(task: TaskItem) -> str:
-    title = task.title or translate_text(("Ohne Titel", "Untitled"))
+    title = task.title or _UNTITLED_TASK_LABEL
     if task.due:
-        due_value = task.due.astimezone().strftime("%Y-%m-%d")
-        return translate_text((f"{title} · Fällig {due_value}", f"{title} · Due {due_value}"))
+        return _TASK_DUE_TEMPLATE.format(title=title, due=task.due.astimezone().strftime("%Y-%m-%d"))
     return title
 
 
+# Runs as a fragment: Refresh, list selection and task creation only rerun this
+# panel instead of the whole page with its calendar iframes. The workspace
+# state is session-only, so the app-level save batching is not needed here.
+@st.fragment
 def _render_tasks_section() -> None:
     panel = st.container(border=True)
     header_cols = panel.columns([0.75, 0.25])
@@ -322,8 +476,19 @@ def _render_tasks_section() -> None:
         )
         return
 
-    token_store = get_default_token_store()
-    if not token_store.load_token(connected_email):
+    try:
+        service = _get_tasks_service_for(connected_email)
+    except OAuthFlowError as exc:
+        panel.error(
+            translate_text(
+                (
+                    f"Google-Anmeldung fehlgeschlagen: {exc}",
+                    f"Google sign-in failed: {exc}",
+                )
+            )
+        )
+        return
+    if service is None:
         panel.info(
             translate_text(
                 (
@@ -334,37 +499,29 @@ def _render_tasks_section() -> None:
         )
         return
 
-    service = get_tasks_service(connected_email, token_store)
+    cache_version = _tasks_cache_version(bump=refresh_clicked)
     if refresh_clicked:
         try:
-            tasklists = _with_backoff(lambda: list_task_lists(service, max_results=50))
-            st.session_state[TASKLISTS_STATE_KEY] = tasklists
-            if tasklists:
-                current_selection = st.session_state.get(TASKS_SELECTED_LIST_KEY)
-                available_ids = {task_list.list_id for task_list in tasklists}
-                if current_selection not in available_ids:
-                    st.session_state[TASKS_SELECTED_LIST_KEY] = tasklists[0].list_id
+            tasklists = _with_backoff(lambda: _cached_list_task_lists(connected_email, cache_version, _service=service))
+            # Stored as an id -> list mapping so reruns can feed the selectbox without rebuilding it.
+            tasklist_lookup = {task_list.list_id: task_list for task_list in tasklists}
+            st.session_state[TASKLISTS_STATE_KEY] = tasklist_lookup
+            if tasklist_lookup and st.session_state.get(TASKS_SELECTED_LIST_KEY) not in tasklist_lookup:
+                st.session_state[TASKS_SELECTED_LIST_KEY] = tasklists[0].list_id
             selected_id = st.session_state.get(TASKS_SELECTED_LIST_KEY)
             if isinstance(selected_id, str) and selected_id:
-                tasks = _with_backoff(lambda: list_tasks(service, tasklist_id=selected_id, max_results=20))
-                st.session_state[TASKS_STATE_KEY] = tasks
+                tasks = _with_backoff(
+                    lambda: _cached_list_tasks(connected_email, selected_id, cache_version, _service=service)
+                )
+                st.session_state[TASKS_STATE_KEY] = tuple(tasks)
+                _prefetch_other_task_lists(service, tasklists, selected_id=selected_id, cache_version=cache_version)
             _refresh_timestamp("tasks")
             st.session_state.pop(TASKS_ERROR_STATE_KEY, None)
         except (GoogleApiError, OAuthFlowError) as exc:
+            st.session_state.pop(TASKS_SERVICE_STATE_KEY, None)
             st.session_state[TASKS_ERROR_STATE_KEY] = str(exc)
 
-    last_refresh = _get_last_refresh("tasks")
-    if last_refresh:
-        panel.caption(
-            translate_text(
-                (
-                    f"Zuletzt aktualisiert: {last_refresh}",
-                    f"Last refreshed: {last_refresh}",
-                )
-            )
-        )
-    else:
-        panel.caption(translate_text(("Noch nicht aktualisiert", "Not refreshed yet")))
+    panel.caption(_last_refresh_caption("tasks"))
 
     if TASKS_ERROR_STATE_KEY in st.session_state:
         panel.error(
@@ -376,11 +533,8 @@ def _render_tasks_section() -> None:
             )
         )
 
-    tasklists_state = st.session_state.get(TASKLISTS_STATE_KEY)
-    tasklists = (
-        [item for item in tasklists_state if isinstance(item, TaskList)] if isinstance(tasklists_state, list) else []
-    )
-    if not tasklists:
+    list_lookup: dict[str, TaskList] = st.session_state.get(TASKLISTS_STATE_KEY, {})
+    if not list_lookup:
         panel.info(
             translate_text(
                 (
@@ -391,11 +545,6 @@ def _render_tasks_section() -> None:
         )
         return
 
-    list_lookup = {task_list.list_id: task_list for task_list in tasklists}
-    if not list_lookup:
-        panel.info(translate_text(("Keine Tasklisten verfügbar.", "No task lists available.")))
-        return
-
     selected_list_id = panel.selectbox(
         translate_text(("Taskliste auswählen", "Select task list")),
         options=list(list_lookup.keys()),
@@ -409,17 +558,24 @@ def _render_tasks_section() -> None:
 
     if load_tasks_clicked:
         try:
-            tasks = _with_backoff(lambda: list_tasks(service, tasklist_id=selected_list_id, max_results=20))
-            st.session_state[TASKS_STATE_KEY] = tasks
+            prefetched_tasks = _take_prefetched_tasks(selected_list_id, cache_version=cache_version)
+            tasks = (
+                prefetched_tasks
+                if prefetched_tasks is not None
+                else _with_backoff(
+                    lambda: _cached_list_tasks(connected_email, selected_list_id, cache_version, _service=service)
+                )
+            )
+            st.session_state[TASKS_STATE_KEY] = tuple(tasks)
             _refresh_timestamp("tasks")
             st.session_state.pop(TASKS_ERROR_STATE_KEY, None)
         except (GoogleApiError, OAuthFlowError) as exc:
+            st.session_state.pop(TASKS_SERVICE_STATE_KEY, None)
             st.session_state[TASKS_ERROR_STATE_KEY] = str(exc)
 
-    tasks_state = st.session_state.get(TASKS_STATE_KEY)
-    tasks = [item for item in tasks_state if isinstance(item, TaskItem)] if isinstance(tasks_state, list) else []
-    if tasks:
-        panel.markdown("\n".join(f"- {_format_task_item(task)}" for task in tasks))
+    task_items: tuple[TaskItem, ...] = st.session_state.get(TASKS_STATE_KEY, ())
+    if task_items:
+        panel.markdown("\n".join(f"- {_format_task_item(task)}" for task in task_items))
     else:
         panel.info(translate_text(("Keine Aufgaben gefunden.", "No tasks found.")))
 
@@ -469,11 +625,18 @@ def _render_tasks_section() -> None:
                                 )
                             )
                         )
-                        tasks = _with_backoff(lambda: list_tasks(service, tasklist_id=selected_list_id, max_results=20))
-                        st.session_state[TASKS_STATE_KEY] = tasks
+                        # The new task must show up; the bumped version also retires prefetched listings.
+                        cache_version = _tasks_cache_version(bump=True)
+                        tasks = _with_backoff(
+                            lambda: _cached_list_tasks(
+                                connected_email, selected_list_id, cache_version, _service=service
+                            )
+                        )
+                        st.session_state[TASKS_STATE_KEY] = tuple(tasks)
                         _refresh_timestamp("tasks")
                         st.session_state.pop(TASKS_ERROR_STATE_KEY, None)
                     except (GoogleApiError, OAuthFlowError) as exc:
+                        st.session_state.pop(TASKS_SERVICE_STATE_KEY, None)
                         panel.error(
                             translate_text(
                                 (
@@ -484,6 +647,83 @@ def _render_tasks_section() -> None:
                         )
 
 
+class _ServiceSection(TypedDict):
+    service_key: str
+    title: tuple[str, str]
+    description: tuple[str, str]
+    items: Sequence[str]
+
+
+# Sample content for the services that are not wired up yet. The item texts are
+# fixed, so they are translated once at import instead of on every rerun.
+_SAMPLE_SERVICE_SECTIONS: dict[str, _ServiceSection] = {
+    "calendar": {
+        "service_key": "calendar",
+        "title": ("Kalender", "Calendar"),
+        "description": (
+            "Bevorstehende Termine aus deinen geteilten Kalendern.",
+            "Upcoming events from your shared calendars.",
+        ),
+        "items": tuple(
+            translate_text(item)
+            for item in (
+                ("Team-Standup · Heute 09:30", "Team stand-up · Today 09:30"),
+                ("Review-Session · Morgen 14:00", "Review session · Tomorrow 14:00"),
+                ("Fokusblock · Freitag 10:00", "Focus block · Friday 10:00"),
+            )
+        ),
+    },
+    "gmail": {
+        "service_key": "gmail",
+        "title": ("Gmail", "Gmail"),
+        "description": (
+            "Neueste Threads aus deinem Posteingang.",
+            "Latest threads from your inbox.",
+        ),
+        "items": tuple(
+            translate_text(item)
+            for item in (
+                ("Projekt-Update von Lea · Antwort bis heute", "Project update from Lea · reply due today"),
+                ("Kundentermin bestätigt · 2 Anhänge", "Client meeting confirmed · 2 attachments"),
+                ("Newsletter: Produktivitätstipps", "Newsletter: productivity tips"),
+            )
+        ),
+    },
+    "drive": {
+        "service_key": "drive",
+        "title": ("Drive", "Drive"),
+        "description": (
+            "Zuletzt geöffnete Dateien in Google Drive.",
+            "Recently opened files in Google Drive.",
+        ),
+        "items": tuple(
+            translate_text(item)
+            for item in (
+                ("Projekt-Roadmap.pdf", "Project roadmap.pdf"),
+                ("Team-Ziele Q3", "Team goals Q3"),
+                ("Budget-Entwurf.xlsx", "Budget draft.xlsx"),
+            )
+        ),
+    },
+    "sheets": {
+        "service_key": "sheets",
+        "title": ("Sheets", "Sheets"),
+        "description": (
+            "Aktive Tabellen mit zuletzt bearbeiteten Blättern.",
+            "Active spreadsheets with recently edited sheets.",
+        ),
+        "items": tuple(
+            translate_text(item)
+            for item in (
+                ("Sprint-Planung", "Sprint planning"),
+                ("Personal-Tracker", "Staff tracker"),
+                ("Ziel-Metriken", "Goal metrics"),
+            )
+        ),
+    },
+}
+
+
 def render_google_workspace_page() -> None:
     st.markdown(translate_text(("### Google Workspace", "### Google Workspace")))
     st.caption(
@@ -495,91 +735,13 @@ def render_google_workspace_page() -> None:
         )
     )
 
-    _render_service_section(
-        service_key="calendar",
-        title=("Kalender", "Calendar"),
-        description=(
-            "Bevorstehende Termine aus deinen geteilten Kalendern.",
-            "Upcoming events from your shared calendars.",
-        ),
-        items=[
-            translate_text(
-                (
-                    "Team-Standup · Heute 09:30",
-                    "Team stand-up · Today 09:30",
-                )
-            ),
-            translate_text(
-                (
-                    "Review-Session · Morgen 14:00",
-                    "Review session · Tomorrow 14:00",
-                )
-            ),
-            translate_text(
-                (
-                    "Fokusblock · Freitag 10:00",
-                    "Focus block · Friday 10:00",
-                )
-            ),
-        ],
-    )
+    _render_service_section(**_SAMPLE_SERVICE_SECTIONS["calendar"])
     render_shared_calendar()
 
-    _render_service_section(
-        service_key="gmail",
-        title=("Gmail", "Gmail"),
-        description=(
-            "Neueste Threads aus deinem Posteingang.",
-            "Latest threads from your inbox.",
-        ),
-        items=[
-            translate_text(
-                (
-                    "Projekt-Update von Lea · Antwort bis heute",
-                    "Project update from Lea · reply due today",
-                )
-            ),
-            translate_text(
-                (
-                    "Kundentermin bestätigt · 2 Anhänge",
-                    "Client meeting confirmed · 2 attachments",
-                )
-            ),
-            translate_text(
-                (
-                    "Newsletter: Produktivitätstipps",
-                    "Newsletter: productivity tips",
-                )
-            ),
-        ],
-    )
+    _render_service_section(**_SAMPLE_SERVICE_SECTIONS["gmail"])
 
     _render_tasks_section()
 
-    _render_service_section(
-        service_key="drive",
-        title=("Drive", "Drive"),
-        description=(
-            "Zuletzt geöffnete Dateien in Google Drive.",
-            "Recently opened files in Google Drive.",
-        ),
-        items=[
-            translate_text(("Projekt-Roadmap.pdf", "Project roadmap.pdf")),
-            translate_text(("Team-Ziele Q3", "Team goals Q3")),
-            translate_text(("Budget-Entwurf.xlsx", "Budget draft.xlsx")),
-        ],
-    )
+    _render_service_section(**_SAMPLE_SERVICE_SECTIONS["drive"])
 
-    _render_service_section(
-        service_key="sheets",
-        title=("Sheets", "Sheets"),
-        description=(
-            "Aktive Tabellen mit zuletzt bearbeiteten Blättern.",
-            "Active spreadsheets with recently edited sheets.",
-        ),
-        items=[
-            translate_text(("Sprint-Planung", "Sprint planning")),
-            translate_text(("Personal-Tracker", "Staff tracker")),
-            translate_text(("Ziel-Metriken", "Goal metrics")),
-        ],
-    )
+    _render_service_section(**_SAMPLE_SERVICE_SECTIONS["sheets"])
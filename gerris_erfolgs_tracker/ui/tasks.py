@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any, Literal, Mapping, Optional, Sequence, cast
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Final, Literal, Mapping, Optional, Sequence, cast
 
 import streamlit as st
 from openai import OpenAI
+from pydantic import TypeAdapter
 
 from gerris_erfolgs_tracker.ai_features import (
     AISuggestion,
+    request_milestone_suggestions,
     suggest_daily_plan,
     suggest_milestones,
     suggest_quadrant,
@@ -16,6 +20,7 @@ from gerris_erfolgs_tracker.ai_features import (
 from gerris_erfolgs_tracker.calendar_view import render_calendar_view
 from gerris_erfolgs_tracker.coach.engine import process_event
 from gerris_erfolgs_tracker.coach.factory import build_completion_event
+from gerris_erfolgs_tracker.coach.plan_cache import PlanCache
 from gerris_erfolgs_tracker.coach.task_analyzer_models import MilestonePlanItem, TaskAIProposal
 from gerris_erfolgs_tracker.constants import (
     AI_ENABLED_KEY,
@@ -49,6 +54,7 @@ from gerris_erfolgs_tracker.constants import (
     NEW_TODO_TITLE_KEY,
     PENDING_DELETE_TODO_KEY,
     SS_SETTINGS,
+    TASK_AI_PLAN_CACHE_KEY,
     TASK_AI_PROPOSAL_APPLY_KEY,
     TASK_AI_PROPOSAL_KEY,
     TODO_TEMPLATE_LAST_APPLIED_KEY,
@@ -74,6 +80,7 @@ from gerris_erfolgs_tracker.models import (
     EmailReminderOffset,
     GamificationMode,
     JournalEntry,
+    KanbanCard,
     KpiStats,
     Milestone,
     MilestoneComplexity,
@@ -81,7 +88,7 @@ from gerris_erfolgs_tracker.models import (
     RecurrencePattern,
     TodoItem,
 )
-from gerris_erfolgs_tracker.state import get_todos
+from gerris_erfolgs_tracker.state import batch_saves, get_todos
 from gerris_erfolgs_tracker.storage import AttachmentPayload, resolve_attachment_path
 from gerris_erfolgs_tracker.todos import (
     add_kanban_card,
@@ -89,8 +96,8 @@ from gerris_erfolgs_tracker.todos import (
     add_todo,
     delete_todo,
     duplicate_todo,
-    move_kanban_card,
-    move_milestone,
+    set_kanban_card_column,
+    set_milestone_status,
     toggle_complete,
     update_milestone,
     update_todo,
@@ -99,6 +106,16 @@ from gerris_erfolgs_tracker.ui.common import quadrant_badge
 
 SortOverride = Literal["priority", "due_date", "created_at"]
 
+# Selectbox options and their positions, built once instead of on every rerun.
+_QUADRANTS: tuple[EisenhowerQuadrant, ...] = tuple(EisenhowerQuadrant)
+_QUADRANT_INDEX: dict[EisenhowerQuadrant, int] = {quadrant: index for index, quadrant in enumerate(_QUADRANTS)}
+_COMPLEXITIES: tuple[MilestoneComplexity, ...] = tuple(MilestoneComplexity)
+_COMPLEXITY_INDEX: dict[MilestoneComplexity, int] = {
+    complexity: index for index, complexity in enumerate(_COMPLEXITIES)
+}
+_PRIORITIES: tuple[int, ...] = tuple(range(1, 6))
+_PRIORITY_INDEX: dict[int, int] = {priority: index for index, priority in enumerate(_PRIORITIES)}
+
 
 def _as_utc_midnight(value: Optional[date | datetime]) -> Optional[datetime]:
     if value is None:
@@ -113,12 +130,18 @@ def _as_utc_midnight(value: Optional[date | datetime]) -> Optional[datetime]:
     return normalized.astimezone(timezone.utc)
 
 
+# Validates a stored suggestion list in one call instead of one model_validate per item.
+_MILESTONE_SUGGESTIONS_ADAPTER: TypeAdapter[list[MilestoneSuggestionItem]] = TypeAdapter(list[MilestoneSuggestionItem])
+
+_COMPLEXITY_POINTS: dict[MilestoneComplexity, int] = {
+    MilestoneComplexity.SMALL: 10,
+    MilestoneComplexity.MEDIUM: 25,
+    MilestoneComplexity.LARGE: 50,
+}
+
+
 def _points_for_complexity(complexity: MilestoneComplexity) -> int:
-    if complexity is MilestoneComplexity.SMALL:
-        return 10
-    if complexity is MilestoneComplexity.MEDIUM:
-        return 25
-    return 50
+    return _COMPLEXITY_POINTS.get(complexity, 50)
 
 
 def _fallback_task_proposal(title: str, *, due_date: Optional[date]) -> TaskAIProposal:
@@ -153,6 +176,52 @@ def _fallback_task_proposal(title: str, *, due_date: Optional[date]) -> TaskAIPr
     )
 
 
+def _task_plan_cache() -> PlanCache:
+    cache = st.session_state.get(TASK_AI_PLAN_CACHE_KEY)
+    if not isinstance(cache, PlanCache):
+        cache = PlanCache()
+        st.session_state[TASK_AI_PLAN_CACHE_KEY] = cache
+    return cache
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _llm_task_proposal(
+    title: str,
+    description: str,
+    due_iso: Optional[str],
+    quadrant_label: str,
+    model: str,
+    *,
+    _client: OpenAI,
+) -> dict[str, Any]:
+    # Repeated clicks with unchanged inputs reuse the answer for an hour; LLMError is not cached.
+    proposal = request_structured_response(
+        client=_client,
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "Du analysierst Aufgaben und schlägst Aufwand, Priorität und Milestones vor. "
+                    "Keine Diagnosen, keine Krisentipps, kein Therapeuten-Rollenspiel. "
+                    "Antworte zweisprachig (DE/EN) und halte dich strikt an das Schema."
+                ),
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Titel: {title}\n"
+                    f"Beschreibung: {description or '—'}\n"
+                    f"Fälligkeit: {due_iso or 'kein Datum'}\n"
+                    f"Quadrant: {quadrant_label}"
+                ),
+            },
+        ],
+        response_model=TaskAIProposal,
+    )
+    return proposal.model_dump()
+
+
 def _request_task_proposal(
     *,
     title: str,
@@ -165,38 +234,63 @@ def _request_task_proposal(
         return AISuggestion(_fallback_task_proposal(title, due_date=due_date), from_ai=False)
 
     today = date.today()
-    model = get_default_model(reasoning=True)
+    plan_cache = _task_plan_cache()
+    cached_plan = plan_cache.adapt(title, description, start_date=today, due_date=due_date)
+    if cached_plan is not None:
+        return AISuggestion(cached_plan, from_ai=True)
+
     try:
-        proposal = request_structured_response(
-            client=client,
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Du analysierst Aufgaben und schlägst Aufwand, Priorität und Milestones vor. "
-                        "Keine Diagnosen, keine Krisentipps, kein Therapeuten-Rollenspiel. "
-                        "Antworte zweisprachig (DE/EN) und halte dich strikt an das Schema."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"Titel: {title}\n"
-                        f"Beschreibung: {description or '—'}\n"
-                        f"Fälligkeit: {due_date or 'kein Datum'}\n"
-                        f"Quadrant: {quadrant.label}"
-                    ),
-                },
-            ],
-            response_model=TaskAIProposal,
+        proposal_data = _llm_task_proposal(
+            title,
+            description,
+            due_date.isoformat() if due_date else None,
+            quadrant.label,
+            get_default_model(reasoning=True),
+            _client=client,
         )
-        validated = TaskAIProposal.model_validate(proposal.model_dump() | {"start_date": today, "due_date": due_date})
+        validated = TaskAIProposal.model_validate(proposal_data | {"start_date": today, "due_date": due_date})
+        plan_cache.store(title, description, validated)
         return AISuggestion(validated, from_ai=True)
     except LLMError:
         return AISuggestion(_fallback_task_proposal(title, due_date=due_date), from_ai=False)
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _llm_milestone_suggestions(
+    todo_title: str,
+    gamification_mode: str,
+    model: str,
+    *,
+    _client: OpenAI,
+) -> MilestoneSuggestionList:
+    return request_milestone_suggestions(
+        todo_title,
+        gamification_mode=GamificationMode(gamification_mode),
+        client=_client,
+        model=model,
+    )
+
+
+def _suggest_milestones_cached(
+    todo_title: str,
+    *,
+    gamification_mode: GamificationMode,
+    client: Optional[OpenAI],
+) -> AISuggestion[MilestoneSuggestionList]:
+    if client is None or not todo_title.strip():
+        return suggest_milestones(todo_title, gamification_mode=gamification_mode, client=None)
+    try:
+        result = _llm_milestone_suggestions(
+            todo_title,
+            gamification_mode.value,
+            get_default_model(reasoning=True),
+            _client=client,
+        )
+    except LLMError:
+        return suggest_milestones(todo_title, gamification_mode=gamification_mode, client=None)
+    return AISuggestion(result, from_ai=True)
+
+
 def _render_task_proposal_editor(*, due_date: Optional[date]) -> Optional[TaskAIProposal]:
     if not st.session_state.get(TASK_AI_PROPOSAL_KEY):
         return None
@@ -226,15 +320,15 @@ def _render_task_proposal_editor(*, due_date: Optional[date]) -> Optional[TaskAI
     )
     suggested_quadrant = st.selectbox(
         "Quadrant-Vorschlag / Quadrant suggestion",
-        options=list(EisenhowerQuadrant),
-        index=list(EisenhowerQuadrant).index(proposal.suggested_quadrant),
+        options=_QUADRANTS,
+        index=_QUADRANT_INDEX[proposal.suggested_quadrant],
         format_func=lambda option: option.label,
         key=f"{TASK_AI_PROPOSAL_KEY}_quadrant",
     )
     suggested_priority = st.selectbox(
         "Priorität (1=hoch) / Priority (1=high)",
-        options=list(range(1, 6)),
-        index=list(range(1, 6)).index(proposal.suggested_priority),
+        options=_PRIORITIES,
+        index=_PRIORITY_INDEX[proposal.suggested_priority],
         key=f"{TASK_AI_PROPOSAL_KEY}_priority",
     )
 
@@ -297,19 +391,24 @@ def _render_task_proposal_editor(*, due_date: Optional[date]) -> Optional[TaskAI
     return updated
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskTemplate:
     key: str
     label: str
     description: str
     settings: Mapping[str, Any]
 
+    def __post_init__(self) -> None:
+        # Templates are cached and shared between sessions, so keep the settings read-only.
+        object.__setattr__(self, "settings", MappingProxyType(dict(self.settings)))
+
 
-def _todo_templates(*, today: date) -> list[TaskTemplate]:
+@lru_cache(maxsize=4)
+def _todo_templates(*, today: date) -> tuple[TaskTemplate, ...]:
     next_week = today + timedelta(days=7)
     deep_dive_due = today + timedelta(days=2)
 
-    return [
+    return (
         TaskTemplate(
             key="free",
             label="Freie Eingabe",
@@ -367,13 +466,11 @@ def _todo_templates(*, today: date) -> list[TaskTemplate]:
                 NEW_TODO_RECURRENCE_KEY: RecurrencePattern.ONCE,
             },
         ),
-    ]
+    )
 
 
 def _apply_task_template(template: TaskTemplate) -> None:
-    for key, value in template.settings.items():
-        st.session_state[key] = value
-    st.session_state[TODO_TEMPLATE_LAST_APPLIED_KEY] = template.key
+    st.session_state.update({**template.settings, TODO_TEMPLATE_LAST_APPLIED_KEY: template.key})
 
 
 def _current_gamification_mode() -> GamificationMode:
@@ -384,20 +481,37 @@ def _current_gamification_mode() -> GamificationMode:
         return GamificationMode.POINTS
 
 
+# Constant messages and message templates, translated once instead of on every rerun.
+_DELETE_PROMPT: Final[str] = translate_text(
+    (
+        "Bist du sicher? Diese Aufgabe wird dauerhaft entfernt.",
+        "Are you sure? This task will be removed permanently.",
+    )
+)
+_LEVEL_UP_TEMPLATE: Final[str] = translate_text(
+    ("🎉 Levelaufstieg! Du bist jetzt Level {level}.", "🎉 Level up! You reached level {level}.")
+)
+_NEW_BADGE_TEMPLATE: Final[str] = translate_text(("🏅 Neues Abzeichen: {badge}", "🏅 New badge unlocked: {badge}"))
+_COMPLETION_SUCCESS_TEMPLATE: Final[str] = translate_text(
+    ("Aktivität '{title}' wurde als erledigt gespeichert.", "Activity '{title}' marked as done.")
+)
+_JOURNAL_COMPLETION_TEMPLATE: Final[str] = translate_text(("Aufgabe abgeschlossen: {title}", "Task completed: {title}"))
+_ATTACHMENT_MISSING_TEMPLATE: Final[str] = translate_text(("{filename} nicht gefunden", "{filename} not found"))
+_JOURNAL_NOTES_TEMPLATE: Final[str] = translate_text(("Journal-Notizen am: {dates}", "Journal mentions on: {dates}"))
+_JOURNAL_MENTIONS_TEMPLATE: Final[str] = translate_text(
+    ("Im Tagebuch erwähnt am: {dates}", "Mentioned in the journal on: {dates}")
+)
+_SHOW_MORE_TEMPLATE: Final[str] = translate_text(("Mehr anzeigen ({count})", "Show more ({count})"))
+
+
 def _render_delete_confirmation(todo: TodoItem, *, key_prefix: str) -> None:
     pending_key = f"{PENDING_DELETE_TODO_KEY}_{todo.id}"
     delete_label = "Löschen"
     confirm_label = "Ja, endgültig löschen"
     cancel_label = "Abbrechen"
-    prompt = translate_text(
-        (
-            "Bist du sicher? Diese Aufgabe wird dauerhaft entfernt.",
-            "Are you sure? This task will be removed permanently.",
-        )
-    )
 
     if st.session_state.get(pending_key):
-        st.warning(prompt)
+        st.warning(_DELETE_PROMPT)
         confirm_cols = st.columns(2)
         if confirm_cols[0].button(confirm_label, key=f"{key_prefix}_confirm_{todo.id}"):
             st.session_state.pop(pending_key, None)
@@ -428,38 +542,17 @@ def _celebrate_gamification_changes(before: GamificationState, after: Gamificati
     new_badges = [badge for badge in after.badges if badge not in before.badges]
 
     if after.level > before.level:
-        st.toast(
-            translate_text(
-                (
-                    f"🎉 Levelaufstieg! Du bist jetzt Level {after.level}.",
-                    f"🎉 Level up! You reached level {after.level}.",
-                )
-            )
-        )
+        st.toast(_LEVEL_UP_TEMPLATE.format(level=after.level))
 
     for badge in new_badges:
-        st.toast(
-            translate_text(
-                (
-                    f"🏅 Neues Abzeichen: {badge}",
-                    f"🏅 New badge unlocked: {badge}",
-                )
-            )
-        )
+        st.toast(_NEW_BADGE_TEMPLATE.format(badge=badge))
 
 
 def handle_completion_success(todo: TodoItem, *, previous_state: GamificationState | None = None) -> None:
     before_state = previous_state or gamification_snapshot()
     after_state = get_gamification_state()
     _celebrate_gamification_changes(before_state, after_state)
-    st.success(
-        translate_text(
-            (
-                f"Aktivität '{todo.title}' wurde als erledigt gespeichert.",
-                f"Activity '{todo.title}' marked as done.",
-            )
-        )
-    )
+    st.success(_COMPLETION_SUCCESS_TEMPLATE.format(title=todo.title))
 
 
 def _toggle_todo_completion(todo: TodoItem) -> None:
@@ -481,9 +574,8 @@ def _render_completion_journal_prompt(todos: Sequence[TodoItem]) -> None:
     if not isinstance(prompt_data, Mapping):
         return
 
-    todo_lookup = {todo.id: todo for todo in todos}
     todo_id = str(prompt_data.get("todo_id", ""))
-    target = todo_lookup.get(todo_id)
+    target = next((todo for todo in todos if todo.id == todo_id), None) if todo_id else None
     if not target:
         st.session_state.pop(JOURNAL_COMPLETION_PROMPT_KEY, None)
         st.session_state.pop(JOURNAL_COMPLETION_NOTE_KEY, None)
@@ -522,12 +614,7 @@ def _render_completion_journal_prompt(todos: Sequence[TodoItem]) -> None:
         if save_clicked:
             today = date.today()
             entry = get_journal_entry(today) or JournalEntry(date=today)
-            completion_text = translate_text(
-                (
-                    f"Aufgabe abgeschlossen: {target.title}",
-                    f"Task completed: {target.title}",
-                )
-            )
+            completion_text = _JOURNAL_COMPLETION_TEMPLATE.format(title=target.title)
             if note_value.strip():
                 completion_text = f"{completion_text} – {note_value.strip()}"
             triggers = entry.triggers_and_reactions.strip()
@@ -554,43 +641,83 @@ def _render_completion_journal_prompt(todos: Sequence[TodoItem]) -> None:
             st.rerun()
 
 
-def _task_sort_key(todo: TodoItem, sort_override: SortOverride) -> tuple[object, ...]:
-    due_key = (todo.due_date is None, todo.due_date or datetime.max)
-    created_key = todo.created_at or datetime.max
+_DT_MAX: Final[datetime] = datetime.max
+
+
+def _due_sort_key(todo: TodoItem) -> tuple[object, ...]:
+    due_date = todo.due_date
+    created_at = todo.created_at or _DT_MAX
+    if due_date is None:
+        return (True, _DT_MAX, todo.priority, created_at)
+    return (False, due_date, todo.priority, created_at)
 
-    if sort_override == "due_date":
-        return (due_key, todo.priority, created_key)
-    if sort_override == "created_at":
-        return (created_key, todo.priority, due_key)
-    return (todo.priority, *due_key, created_key)
+
+def _created_sort_key(todo: TodoItem) -> tuple[object, ...]:
+    due_date = todo.due_date
+    return (todo.created_at or _DT_MAX, todo.priority, due_date is None, due_date or _DT_MAX)
+
+
+def _priority_sort_key(todo: TodoItem) -> tuple[object, ...]:
+    due_date = todo.due_date
+    return (todo.priority, due_date is None, due_date or _DT_MAX, todo.created_at or _DT_MAX)
+
+
+_PRIORITY_SORTS: Final[dict[SortOverride, Callable[[TodoItem], tuple[object, ...]]]] = {
+    "due_date": _due_sort_key,
+    "created_at": _created_sort_key,
+    "priority": _priority_sort_key,
+}
 
 
 def _render_subtask_progress(todo: TodoItem) -> None:
     kanban = todo.kanban
-    done_column_id = kanban.done_column_id()
     total_cards = len(kanban.cards)
-    done_cards = len([card for card in kanban.cards if card.column_id == done_column_id])
-
     if total_cards == 0:
         st.caption("Keine Unteraufgaben vorhanden.")
         return
 
-    completion_ratio = done_cards
+    done_column_id = kanban.done_column_id()
+    done_cards = sum(card.column_id == done_column_id for card in kanban.cards)
     st.progress(
-        completion_ratio,
+        done_cards / total_cards,
         text=f"{done_cards}/{total_cards} Unteraufgaben erledigt",
     )
 
 
+_MILESTONE_STATUSES: tuple[MilestoneStatus, ...] = tuple(MilestoneStatus)
+_MILESTONE_STATUS_BY_LABEL: dict[str, MilestoneStatus] = {status.label: status for status in _MILESTONE_STATUSES}
+_COMPLEXITY_BY_LABEL: dict[str, MilestoneComplexity] = {complexity.label: complexity for complexity in _COMPLEXITIES}
+
+
+def _milestone_sort_key(milestone: Milestone) -> tuple[int, str]:
+    return -milestone.points, milestone.title.lower()
+
+
+_KANBAN_COLUMN_LABELS: dict[str, str] = {
+    "backlog": "Backlog",
+    "doing": "In Arbeit",
+    "done": "Erledigt",
+}
+
+
+def _card_snippet(card: KanbanCard) -> str:
+    description = card.description_md.strip()
+    if not description:
+        return ""
+    snippet = description.splitlines()[0]
+    return snippet[:140] + ("…" if len(snippet) > 140 else "")
+
+
+def _editor_key(prefix: str, rows: Sequence[Mapping[str, object]]) -> str:
+    # The board data is part of the key so a fresh editor replaces stale edits after every change.
+    signature = hash(tuple(tuple(row.values()) for row in rows))
+    return f"{prefix}_{signature & 0xFFFFFFFFFFFF:x}"
+
+
 def _render_todo_kanban(todo: TodoItem) -> None:
     st.markdown("#### Kanban")
     kanban = todo.kanban
-    ordered_columns = sorted(kanban.columns, key=lambda column: column.order)
-    column_labels: dict[str, str] = {
-        "backlog": "Backlog",
-        "doing": "In Arbeit",
-        "done": "Erledigt",
-    }
+    ordered_columns = kanban.ordered_columns()
 
     _render_subtask_progress(todo)
 
@@ -616,42 +743,49 @@ def _render_todo_kanban(todo: TodoItem) -> None:
 
     st.markdown("#### Spalten")
     column_containers = st.columns(len(ordered_columns))
-    cards_by_column: dict[str, list] = {column.id: [] for column in ordered_columns}
-    for card in sorted(kanban.cards, key=lambda card: card.created_at):
-        cards_by_column.setdefault(card.column_id, []).append(card)
-
-    for column_index, (column, container) in enumerate(zip(ordered_columns, column_containers, strict=True)):
+    cards_by_column: dict[str, list[KanbanCard]] = {column.id: [] for column in ordered_columns}
+    for card in kanban.cards_by_created():
+        bucket = cards_by_column.get(card.column_id)
+        if bucket is not None:
+            bucket.append(card)
+
+    column_labels = {column.id: _KANBAN_COLUMN_LABELS.get(column.id, column.title) for column in ordered_columns}
+    column_ids_by_label = {label: column_id for column_id, label in column_labels.items()}
+    for column, container in zip(ordered_columns, column_containers, strict=True):
         with container:
-            label = column_labels.get(column.id, column.title)
-            st.markdown(f"**{label}**")
-            column_cards = cards_by_column.get(column.id, [])
+            st.markdown(f"**{column_labels[column.id]}**")
+            column_cards = cards_by_column[column.id]
             if not column_cards:
                 st.caption("Keine Karten hier.")
                 continue
 
-            for card in column_cards:
-                with st.container(border=True):
-                    st.markdown(card.title)
-                    if card.description_md.strip():
-                        snippet = card.description_md.strip().splitlines()[0]
-                        st.caption(snippet[:140] + ("…" if len(snippet) > 140 else ""))
-
-                    move_columns = st.columns(2)
-                    if move_columns[0].button(
-                        "← Links",
-                        key=f"kanban_move_left_{todo.id}_{card.id}",
-                        disabled=column_index == 0,
-                    ):
-                        move_kanban_card(todo.id, card_id=card.id, direction="left")
-                        st.rerun()
-
-                    if move_columns[1].button(
-                        "Rechts →",
-                        key=f"kanban_move_right_{todo.id}_{card.id}",
-                        disabled=column_index == len(ordered_columns) - 1,
-                    ):
-                        move_kanban_card(todo.id, card_id=card.id, direction="right")
-                        st.rerun()
+            column_label = column_labels[column.id]
+            rows = [
+                {"Karte": card.title, "Details": _card_snippet(card), "Spalte": column_label} for card in column_cards
+            ]
+            edited_rows = st.data_editor(
+                rows,
+                column_config={
+                    "Karte": st.column_config.TextColumn(disabled=True),
+                    "Details": st.column_config.TextColumn(disabled=True),
+                    "Spalte": st.column_config.SelectboxColumn(
+                        options=list(column_ids_by_label),
+                        required=True,
+                    ),
+                },
+                hide_index=True,
+                key=_editor_key(f"kanban_editor_{todo.id}_{column.id}", rows),
+            )
+            moves = [
+                (card, column_ids_by_label[str(row["Spalte"])])
+                for card, row in zip(column_cards, edited_rows, strict=True)
+                if row["Spalte"] != column_label
+            ]
+            if moves:
+                with batch_saves():
+                    for card, target_column_id in moves:
+                        set_kanban_card_column(todo.id, card_id=card.id, column_id=target_column_id)
+                st.rerun()
 
 
 def _render_milestone_suggestions(
@@ -662,7 +796,7 @@ def _render_milestone_suggestions(
 ) -> None:
     suggestion_store: dict[str, list[dict[str, str]]] = st.session_state.get(NEW_MILESTONE_SUGGESTIONS_KEY, {})
     raw_suggestions = suggestion_store.get(todo.id, [])
-    suggestions = [MilestoneSuggestionItem.model_validate(item) for item in raw_suggestions]
+    suggestions = _MILESTONE_SUGGESTIONS_ADAPTER.validate_python(raw_suggestions)
 
     trigger_ai = st.button(
         "AI: Meilensteine vorschlagen",
@@ -672,7 +806,7 @@ def _render_milestone_suggestions(
     )
 
     if trigger_ai:
-        suggestion: AISuggestion[MilestoneSuggestionList] = suggest_milestones(
+        suggestion = _suggest_milestones_cached(
             todo.title,
             gamification_mode=gamification_mode,
             client=get_openai_client() if ai_enabled else None,
@@ -717,69 +851,74 @@ def _render_milestone_board(todo: TodoItem, *, gamification_mode: GamificationMo
     st.markdown("#### Unterziele & Meilensteine")
     st.caption("Plane Etappenziele, die du auf einem kleinen Priority-Board nachverfolgst.")
 
-    status_order = list(MilestoneStatus)
+    status_order = _MILESTONE_STATUSES
+    milestones_by_status: dict[MilestoneStatus, list[Milestone]] = {status: [] for status in status_order}
+    for milestone in sorted(todo.milestones, key=_milestone_sort_key):
+        milestones_by_status[milestone.status].append(milestone)
+
     status_columns = st.columns(len(status_order))
     for status, column in zip(status_order, status_columns, strict=True):
         with column:
             column.markdown(f"**{status.label}**")
-            items = [item for item in todo.milestones if item.status is status]
+            items = milestones_by_status[status]
             if not items:
                 column.caption("Keine Einträge")
                 continue
 
-            for milestone in sorted(items, key=lambda item: (-item.points, item.title.lower())):
-                with st.container(border=True):
-                    st.markdown(f"**{milestone.title}**")
-                    st.caption(f"{milestone.complexity.label} · {milestone.points} Punkte")
-                    if milestone.note.strip():
-                        st.markdown(milestone.note)
-
-                    move_cols = st.columns(2)
-                    if move_cols[0].button(
-                        "←", key=f"milestone_left_{todo.id}_{milestone.id}", disabled=status is status_order[0]
-                    ):
-                        move_milestone(todo.id, milestone.id, direction="left")
-                        st.rerun()
-                    if move_cols[1].button(
-                        "→",
-                        key=f"milestone_right_{todo.id}_{milestone.id}",
-                        disabled=status is status_order[-1],
-                    ):
-                        move_milestone(todo.id, milestone.id, direction="right")
-                        st.rerun()
-
-                    with st.form(f"milestone_edit_{todo.id}_{milestone.id}"):
-                        edit_complexity = st.selectbox(
-                            "Aufwand",
-                            options=list(MilestoneComplexity),
-                            format_func=lambda option: option.label,
-                            index=list(MilestoneComplexity).index(milestone.complexity),
-                            key=f"milestone_complexity_{todo.id}_{milestone.id}",
-                        )
-                        recommended_points = _points_for_complexity(edit_complexity)
-                        edit_points = st.number_input(
-                            "Punkte",
-                            min_value=0,
-                            value=int(milestone.points or recommended_points),
-                            step=1,
-                            key=f"milestone_points_{todo.id}_{milestone.id}",
-                            help=f"Empfohlen: {recommended_points}",
-                        )
-                        edit_note = st.text_area(
-                            "Notiz (optional)",
-                            value=milestone.note,
-                            key=f"milestone_note_{todo.id}_{milestone.id}",
+            rows = [
+                {
+                    "Titel": milestone.title,
+                    "Aufwand": milestone.complexity.label,
+                    "Punkte": milestone.points,
+                    "Notiz": milestone.note,
+                    "Status": milestone.status.label,
+                }
+                for milestone in items
+            ]
+            edited_rows = st.data_editor(
+                rows,
+                column_config={
+                    "Titel": st.column_config.TextColumn(disabled=True),
+                    "Aufwand": st.column_config.SelectboxColumn(
+                        options=list(_COMPLEXITY_BY_LABEL),
+                        required=True,
+                    ),
+                    "Punkte": st.column_config.NumberColumn(
+                        min_value=0,
+                        step=1,
+                        required=True,
+                        help="Empfohlen: "
+                        + ", ".join(
+                            f"{complexity.label} {_points_for_complexity(complexity)}" for complexity in _COMPLEXITIES
+                        ),
+                    ),
+                    "Notiz": st.column_config.TextColumn(),
+                    "Status": st.column_config.SelectboxColumn(
+                        options=list(_MILESTONE_STATUS_BY_LABEL),
+                        required=True,
+                    ),
+                },
+                hide_index=True,
+                key=_editor_key(f"milestone_editor_{todo.id}_{status.value}", rows),
+            )
+            changes = [
+                (milestone, row)
+                for milestone, original, row in zip(items, rows, edited_rows, strict=True)
+                if row != original
+            ]
+            if changes:
+                with batch_saves():
+                    for milestone, row in changes:
+                        update_milestone(
+                            todo.id,
+                            milestone.id,
+                            complexity=_COMPLEXITY_BY_LABEL[str(row["Aufwand"])],
+                            points=int(cast(int, row["Punkte"]) or 0),
+                            note=str(row["Notiz"] or ""),
                         )
-                        if st.form_submit_button("Speichern"):
-                            update_milestone(
-                                todo.id,
-                                milestone.id,
-                                complexity=edit_complexity,
-                                points=int(edit_points),
-                                note=edit_note,
-                            )
-                            st.success("Aktualisiert")
-                            st.rerun()
+                        # Board moves never award points, like the former arrow buttons.
+                        set_milestone_status(todo.id, milestone.id, _MILESTONE_STATUS_BY_LABEL[str(row["Status"])])
+                st.rerun()
 
     st.markdown("##### Neues Unterziel")
     with st.form(f"milestone_add_{todo.id}"):
@@ -790,7 +929,7 @@ def _render_milestone_board(todo: TodoItem, *, gamification_mode: GamificationMo
         )
         complexity = st.selectbox(
             "Aufwand",
-            options=list(MilestoneComplexity),
+            options=_COMPLEXITIES,
             format_func=lambda option: option.label,
             key=f"{NEW_MILESTONE_COMPLEXITY_KEY}_{todo.id}",
         )
@@ -887,26 +1026,12 @@ def render_task_row(
                     if attachment_path.exists():
                         st.image(str(attachment_path), caption=attachment.filename)
                     else:
-                        st.caption(
-                            translate_text(
-                                (
-                                    f"{attachment.filename} nicht gefunden",
-                                    f"{attachment.filename} not found",
-                                )
-                            )
-                        )
+                        st.caption(_ATTACHMENT_MISSING_TEMPLATE.format(filename=attachment.filename))
 
             mentions = journal_links.get(todo.id, []) if journal_links else []
             if mentions:
                 mention_dates = ", ".join(entry_date.isoformat() for entry_date in mentions[:3])
-                st.caption(
-                    translate_text(
-                        (
-                            f"Journal-Notizen am: {mention_dates}",
-                            f"Journal mentions on: {mention_dates}",
-                        )
-                    )
-                )
+                st.caption(_JOURNAL_NOTES_TEMPLATE.format(dates=mention_dates))
 
             st.markdown("#### Terminierung")
             st.caption(f"Wiederholung: {todo.recurrence.label}")
@@ -962,9 +1087,9 @@ def render_task_row(
                     new_due_datetime = _as_utc_midnight(new_due)
                     new_quadrant = st.selectbox(
                         "Eisenhower-Quadrant",
-                        options=list(EisenhowerQuadrant),
+                        options=_QUADRANTS,
                         format_func=lambda option: option.label,
-                        index=list(EisenhowerQuadrant).index(todo.quadrant),
+                        index=_QUADRANT_INDEX[todo.quadrant],
                         key=f"quick_quadrant_{todo.id}",
                         label_visibility="collapsed",
                     )
@@ -1192,7 +1317,7 @@ def render_task_list_view(todos: list[TodoItem], *, journal_links: Mapping[str,
                 continue
 
             st.markdown(f"### {category.label}")
-            sorted_todos = sorted(category_todos, key=lambda item: _task_sort_key(item, sort_override))
+            sorted_todos = sorted(category_todos, key=_PRIORITY_SORTS[sort_override])
             preview_tasks = sorted_todos[:3]
             remaining_tasks = sorted_todos[3:]
 
@@ -1200,12 +1325,7 @@ def render_task_list_view(todos: list[TodoItem], *, journal_links: Mapping[str,
                 render_task_row(todo, parent=task_list_container, journal_links=journal_links)
 
             if remaining_tasks:
-                more_label = translate_text(
-                    (
-                        f"Mehr anzeigen ({len(remaining_tasks)})",
-                        f"Show more ({len(remaining_tasks)})",
-                    )
-                )
+                more_label = _SHOW_MORE_TEMPLATE.format(count=len(remaining_tasks))
                 with st.expander(more_label, expanded=False):
                     for todo in remaining_tasks:
                         render_task_row(todo, parent=task_list_container, journal_links=journal_links)
@@ -1225,7 +1345,6 @@ def render_todo_section(
     open_todos = [todo for todo in todos if not todo.completed]
     completed_todos = [todo for todo in todos if todo.completed]
     journal_links = journal_links or get_journal_links_by_todo()
-    quadrant_options = list(EisenhowerQuadrant)
 
     hero_left, hero_right = st.columns([0.6, 0.4])
     with hero_left:
@@ -1387,7 +1506,7 @@ def render_todo_section(
             )
             milestone_complexity = st.selectbox(
                 "Aufwand / Effort",
-                options=list(MilestoneComplexity),
+                options=_COMPLEXITIES,
                 key=NEW_MILESTONE_COMPLEXITY_KEY,
                 format_func=lambda option: option.label,
             )
@@ -1416,9 +1535,7 @@ def render_todo_section(
                 help="Erzeuge Vorschläge für Unterziele",
             )
 
-            suggestion_candidates = [
-                MilestoneSuggestionItem.model_validate(item) for item in suggestion_store.get("draft", [])
-            ]
+            suggestion_candidates = _MILESTONE_SUGGESTIONS_ADAPTER.validate_python(suggestion_store.get("draft", []))
             if generate_suggestions:
                 milestone_suggestion: AISuggestion[MilestoneSuggestionList] = suggest_milestones(
                     title or "Aufgabe",
@@ -1491,14 +1608,14 @@ def render_todo_section(
 
             quadrant = st.selectbox(
                 "Eisenhower-Quadrant / Quadrant",
-                quadrant_options,
+                _QUADRANTS,
                 key=NEW_TODO_QUADRANT_KEY,
                 format_func=lambda option: option.label,
             )
 
             priority = st.selectbox(
                 "Priorität (1=hoch) / Priority (1=high)",
-                options=list(range(1, 6)),
+                options=_PRIORITIES,
                 key=NEW_TODO_PRIORITY_KEY,
             )
 
@@ -1828,15 +1945,15 @@ def _render_focus_item_editor(todo: TodoItem, *, key_prefix: str) -> None:
                 )
             new_priority = st.selectbox(
                 translate_text(("Priorität (1=hoch)", "Priority (1=high)")),
-                options=list(range(1, 6)),
-                index=list(range(1, 6)).index(todo.priority),
+                options=_PRIORITIES,
+                index=_PRIORITY_INDEX[todo.priority],
                 key=f"{key_prefix}_priority_{todo.id}",
             )
             new_quadrant = st.selectbox(
                 translate_text(("Eisenhower-Quadrant", "Eisenhower quadrant")),
-                options=list(EisenhowerQuadrant),
+                options=_QUADRANTS,
                 format_func=lambda option: option.label,
-                index=list(EisenhowerQuadrant).index(todo.quadrant),
+                index=_QUADRANT_INDEX[todo.quadrant],
                 key=f"{key_prefix}_quadrant_{todo.id}",
             )
             new_category = st.selectbox(
@@ -2002,14 +2119,7 @@ def render_todo_card(todo: TodoItem, *, journal_links: Mapping[str, list[date]]
         mentions = journal_links.get(todo.id, []) if journal_links else []
         if mentions:
             mention_dates = ", ".join(entry_date.isoformat() for entry_date in mentions[:3])
-            st.caption(
-                translate_text(
-                    (
-                        f"Im Tagebuch erwähnt am: {mention_dates}",
-                        f"Mentioned in the journal on: {mention_dates}",
-                    )
-                )
-            )
+            st.caption(_JOURNAL_MENTIONS_TEMPLATE.format(dates=mention_dates))
 
         action_cols = st.columns([1, 1, 1])
         if action_cols[0].button(
@@ -2022,9 +2132,9 @@ def render_todo_card(todo: TodoItem, *, journal_links: Mapping[str, list[date]]
         with action_cols[1]:
             quadrant_selection = st.selectbox(
                 "Quadrant wechseln",
-                options=list(EisenhowerQuadrant),
+                options=_QUADRANTS,
                 format_func=lambda option: option.label,
-                index=list(EisenhowerQuadrant).index(todo.quadrant),
+                index=_QUADRANT_INDEX[todo.quadrant],
                 key=f"quadrant_{todo.id}",
             )
             if quadrant_selection != todo.quadrant:
@@ -2051,9 +2161,9 @@ def render_todo_card(todo: TodoItem, *, journal_links: Mapping[str, list[date]]
                 new_due_datetime = _as_utc_midnight(new_due)
                 new_quadrant = st.selectbox(
                     "Eisenhower-Quadrant",
-                    options=list(EisenhowerQuadrant),
+                    options=_QUADRANTS,
                     format_func=lambda option: option.label,
-                    index=list(EisenhowerQuadrant).index(todo.quadrant),
+                    index=_QUADRANT_INDEX[todo.quadrant],
                     key=f"edit_quadrant_{todo.id}",
                 )
                 new_category = st.selectbox(
@@ -2065,8 +2175,8 @@ def render_todo_card(todo: TodoItem, *, journal_links: Mapping[str, list[date]]
                 )
                 new_priority = st.selectbox(
                     "Priorität (1=hoch)",
-                    options=list(range(1, 6)),
-                    index=list(range(1, 6)).index(todo.priority),
+                    options=_PRIORITIES,
+                    index=_PRIORITY_INDEX[todo.priority],
                     key=f"edit_priority_{todo.id}",
                 )
                 edit_tabs = st.tabs(["Schreiben", "Vorschau"])
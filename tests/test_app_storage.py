@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+import streamlit as st
+
+from app import _bootstrap_storage
+from gerris_erfolgs_tracker.constants import SS_SETTINGS
+from gerris_erfolgs_tracker.state import persist_state
+
+
+def test_bootstrap_storage_appends_later_saves_to_log(
+    session_state: dict[str, object], tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GERRIS_ONEDRIVE_DIR", str(tmp_path))
+
+    backend = _bootstrap_storage()
+    st.session_state[SS_SETTINGS] = {"ai_enabled": False}
+    persist_state()
+
+    assert _bootstrap_storage() is backend
+    st.session_state[SS_SETTINGS] = {"ai_enabled": True}
+    persist_state()
+
+    assert backend.path.exists()
+    _header, *entries = backend.log_path.read_text(encoding="utf-8").splitlines()
+    assert len(entries) == 1
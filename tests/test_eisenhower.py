@@ -52,6 +52,7 @@ def test_grouping_and_sorting() -> None:
 
 def test_quadrant_parsing_and_invalid_input() -> None:
     assert ensure_quadrant("urgent_important") is EisenhowerQuadrant.URGENT_IMPORTANT
+    assert ensure_quadrant("  Not Important & Not Urgent ") is EisenhowerQuadrant.NOT_URGENT_NOT_IMPORTANT
 
     with pytest.raises(ValueError):
         ensure_quadrant("unknown")
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from gerris_erfolgs_tracker.integrations.google.client import GoogleApiError, build_google_api_client
+
+
+def test_google_client_reuses_http_client_and_sends_token() -> None:
+    seen: list[httpx.Request] = []
+
+    def _responder(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"items": []})
+
+    http_client = httpx.Client(transport=httpx.MockTransport(_responder))
+    client = build_google_api_client("secret-token", http_client=http_client)
+
+    assert client.get("https://tasks.googleapis.com/tasks/v1/users/@me/lists") == {"items": []}
+    assert client.post("https://tasks.googleapis.com/tasks/v1/lists/a/tasks", json={"title": "Neu"}) == {"items": []}
+    assert [request.method for request in seen] == ["GET", "POST"]
+    assert all(request.headers["Authorization"] == "Bearer secret-token" for request in seen)
+
+
+def test_google_client_error_carries_status_code() -> None:
+    def _responder(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, json={"error": {"message": "Rate Limit Exceeded"}})
+
+    client = build_google_api_client("token", http_client=httpx.Client(transport=httpx.MockTransport(_responder)))
+
+    with pytest.raises(GoogleApiError) as excinfo:
+        client.get("https://tasks.googleapis.com/tasks/v1/users/@me/lists")
+
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.retriable
+    assert str(excinfo.value) == "Google API request failed: Rate Limit Exceeded"
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import pytest
+
+from gerris_erfolgs_tracker.integrations.google.client import GoogleApiError
+from gerris_erfolgs_tracker.integrations.google.models import TaskItem, TaskList
+from gerris_erfolgs_tracker.integrations.google.services import GoogleService
+from gerris_erfolgs_tracker.storage.token_store import TokenData
+from gerris_erfolgs_tracker.ui.google_workspace import (
+    TASKS_CACHE_TTL_SECONDS,
+    _cached_list_task_lists,
+    _calendar_cells,
+    _calendar_grid_html,
+    _extract_calendar_src,
+    _format_task_item,
+    _get_tasks_service_for,
+    _last_refresh_caption,
+    _prefetch_other_task_lists,
+    _refresh_timestamp,
+    _take_prefetched_tasks,
+    _tasks_cache_version,
+    _with_backoff,
+)
+
+
+def test_extract_calendar_src_reads_embed_urls() -> None:
+    embed_url = "https://calendar.google.com/calendar/embed?cid=other&src=team%40group.calendar.google.com&ctz=UTC"
+
+    assert _extract_calendar_src(embed_url) == "team@group.calendar.google.com"
+    assert _extract_calendar_src("https://calendar.google.com/calendar/u/0?cid=abc123#main") == "abc123"
+
+
+def test_extract_calendar_src_keeps_plain_ids() -> None:
+    assert _extract_calendar_src("  team@group.calendar.google.com ") == "team@group.calendar.google.com"
+    assert _extract_calendar_src("https://example.com/calendar.ics") == "https://example.com/calendar.ics"
+
+
+def test_calendar_cells_fall_back_to_env_calendars(monkeypatch) -> None:
+    monkeypatch.delenv("GOOGLE_CALENDARS_JSON", raising=False)
+    monkeypatch.setenv("CALENDAR_SHARED_2025", "shared@group.calendar.google.com")
+    monkeypatch.setenv("CALENDAR_GERRI", "https://calendar.google.com/calendar/embed?src=gerri%40example.com")
+
+    cells, hint = _calendar_cells()
+
+    assert hint is None
+    assert [(src, color) for _heading, src, color in cells] == [
+        ("shared@group.calendar.google.com", "%23616161"),
+        ("gerri@example.com", "%237986cb"),
+    ]
+
+
+def test_cached_task_lists_reload_after_version_bump(session_state: dict[str, object], monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_list_task_lists(service: Any, *, max_results: int = 20) -> list[TaskList]:
+        calls.append(max_results)
+        return [TaskList(list_id="list-1", title="Privat")]
+
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.list_task_lists", fake_list_task_lists)
+    _cached_list_task_lists.clear()
+    service = cast(GoogleService, object())
+
+    version = _tasks_cache_version()
+    first = _cached_list_task_lists("gerri@example.com", version, _service=service)
+    second = _cached_list_task_lists("gerri@example.com", version, _service=service)
+    assert first == second
+    assert len(calls) == 1
+
+    refreshed_version = _tasks_cache_version(bump=True)
+    _cached_list_task_lists("gerri@example.com", refreshed_version, _service=service)
+    assert refreshed_version != version
+    assert len(calls) == 2
+
+    assert _tasks_cache_version(bump=True) != refreshed_version
+
+
+def test_with_backoff_retries_transient_errors_with_capped_delay(monkeypatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.time.sleep", delays.append)
+    attempts: list[int] = []
+
+    def flaky() -> str:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise GoogleApiError("Backend Error", status_code=503)
+        return "ok"
+
+    assert _with_backoff(flaky, base_delay=4.0, max_delay=5.0) == "ok"
+    assert len(delays) == 2
+    assert 4.0 <= delays[0] <= 6.0
+    assert 5.0 <= delays[1] <= 7.5
+
+
+def test_with_backoff_raises_other_errors_immediately(monkeypatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.time.sleep", delays.append)
+
+    def broken() -> None:
+        raise ValueError("kaputt")
+
+    with pytest.raises(ValueError):
+        _with_backoff(broken)
+    assert delays == []
+
+
+def test_tasks_service_is_reused_until_token_expires(session_state: dict[str, object], monkeypatch) -> None:
+    now = datetime.now(timezone.utc)
+    tokens = {
+        "gerri@example.com": TokenData(
+            access_token="token",
+            refresh_token="refresh",
+            token_type="Bearer",
+            scope=None,
+            expires_at=now + timedelta(hours=1),
+        )
+    }
+    loads: list[str] = []
+
+    class FakeTokenStore:
+        def load_token(self, user_id: str) -> TokenData | None:
+            loads.append(user_id)
+            return tokens.get(user_id)
+
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.get_default_token_store", FakeTokenStore)
+    monkeypatch.setattr(
+        "gerris_erfolgs_tracker.ui.google_workspace.get_tasks_service",
+        lambda user_id, token_store: object(),
+    )
+
+    first = _get_tasks_service_for("gerri@example.com")
+    assert first is not None
+    assert _get_tasks_service_for("gerri@example.com") is first
+    assert loads == ["gerri@example.com"]
+
+    assert _get_tasks_service_for("other@example.com") is None
+
+
+def test_calendar_grid_html_renders_all_calendars_in_one_block() -> None:
+    html = _calendar_grid_html(
+        (("Team <A>", "team@example.com", "%23616161"), ("Gerri", "gerri@example.com", "%237986cb"))
+    )
+
+    assert html.count("<iframe") == 2
+    assert "repeat(2, minmax(0, 1fr))" in html
+    assert "Team &lt;A&gt;" in html
+    assert "repeat(1, minmax(0, 1fr))" in _calendar_grid_html((("Gerri", "gerri@example.com", "%237986cb"),))
+
+
+def test_format_task_item_uses_german_templates() -> None:
+    due = datetime(2025, 3, 14, 12, 0, tzinfo=timezone.utc)
+
+    assert _format_task_item(TaskItem(task_id="1", title="Bericht {final}", status="needsAction", due=due)) == (
+        "Bericht {final} · Fällig 2025-03-14"
+    )
+    assert _format_task_item(TaskItem(task_id="2", title="", status="needsAction")) == "Ohne Titel"
+
+
+def test_with_backoff_fails_fast_on_client_errors(monkeypatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.time.sleep", delays.append)
+    attempts: list[int] = []
+
+    def not_found() -> None:
+        attempts.append(1)
+        raise GoogleApiError("Not Found", status_code=404)
+
+    with pytest.raises(GoogleApiError):
+        _with_backoff(not_found)
+    assert attempts == [1]
+    assert delays == []
+
+
+def test_prefetched_tasks_are_served_once(session_state: dict[str, object], monkeypatch) -> None:
+    def fake_list_tasks(service: Any, *, tasklist_id: str, max_results: int = 20) -> list[TaskItem]:
+        return [TaskItem(task_id=f"{tasklist_id}-1", title=f"Aufgabe {tasklist_id}", status="needsAction")]
+
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.list_tasks", fake_list_tasks)
+    tasklists = [TaskList(list_id="privat", title="Privat"), TaskList(list_id="arbeit", title="Arbeit")]
+
+    _prefetch_other_task_lists(cast(GoogleService, object()), tasklists, selected_id="privat", cache_version="v1")
+    prefetched = cast(dict[str, Any], session_state["workspace_tasks_prefetch"])
+    assert list(prefetched) == ["arbeit"]
+    prefetched["arbeit"][2].result(timeout=5)
+
+    assert _take_prefetched_tasks("privat", cache_version="v1") is None
+    tasks = _take_prefetched_tasks("arbeit", cache_version="v1")
+    assert tasks is not None
+    assert [task.title for task in tasks] == ["Aufgabe arbeit"]
+    assert _take_prefetched_tasks("arbeit", cache_version="v1") is None
+
+
+def test_prefetched_tasks_expire_with_the_listing_cache(session_state: dict[str, object], monkeypatch) -> None:
+    monkeypatch.setattr(
+        "gerris_erfolgs_tracker.ui.google_workspace.list_tasks",
+        lambda service, *, tasklist_id, max_results=20: [],
+    )
+    tasklists = [TaskList(list_id="privat", title="Privat"), TaskList(list_id="arbeit", title="Arbeit")]
+
+    _prefetch_other_task_lists(cast(GoogleService, object()), tasklists, selected_id="privat", cache_version="v1")
+    cast(dict[str, Any], session_state["workspace_tasks_prefetch"])["arbeit"][2].result(timeout=5)
+    assert _take_prefetched_tasks("arbeit", cache_version="v2") is None
+
+    _prefetch_other_task_lists(cast(GoogleService, object()), tasklists, selected_id="privat", cache_version="v1")
+    cast(dict[str, Any], session_state["workspace_tasks_prefetch"])["arbeit"][2].result(timeout=5)
+    later = time.monotonic() + TASKS_CACHE_TTL_SECONDS + 1
+    monkeypatch.setattr("gerris_erfolgs_tracker.ui.google_workspace.time.monotonic", lambda: later)
+    assert _take_prefetched_tasks("arbeit", cache_version="v1") is None
+
+
+def test_refresh_caption_is_stored_beside_the_button_key(session_state: dict[str, object]) -> None:
+    assert _last_refresh_caption("gmail") == "Noch nicht aktualisiert"
+
+    timestamp = _refresh_timestamp("gmail")
+
+    assert _last_refresh_caption("gmail") == f"Zuletzt aktualisiert: {timestamp}"
+    assert "workspace_refresh_gmail" not in session_state
@@ -1,9 +1,9 @@
 from datetime import datetime
 
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
-from gerris_erfolgs_tracker.models import DEFAULT_KANBAN_COLUMNS, TodoKanban
+from gerris_erfolgs_tracker.models import DEFAULT_KANBAN_COLUMNS, KanbanCard, TodoKanban
 from gerris_erfolgs_tracker.state import get_todos, init_state
-from gerris_erfolgs_tracker.todos import add_kanban_card, add_todo, move_kanban_card
+from gerris_erfolgs_tracker.todos import add_kanban_card, add_todo, move_kanban_card, set_kanban_card_column
 
 
 def test_default_columns_present() -> None:
@@ -31,3 +31,62 @@ def test_moving_cards_updates_column_and_done_at(session_state: dict[str, object
 
     refreshed_todo = next(item for item in get_todos() if item.id == todo.id)
     assert refreshed_todo.kanban.cards[0].column_id == DEFAULT_KANBAN_COLUMNS[2].id
+
+
+def test_column_positions_follow_order_and_skip_normalized_boards() -> None:
+    kanban = TodoKanban(columns=list(reversed([column.model_copy() for column in DEFAULT_KANBAN_COLUMNS])))
+
+    assert kanban.ordered_column_ids() == ("backlog", "doing", "done")
+    assert [column.id for column in kanban.ordered_columns()] == ["backlog", "doing", "done"]
+    assert kanban.column_position("done") == 2
+    assert kanban.column_position("missing") is None
+
+    normalized = kanban.ensure_default_columns()
+    assert normalized is not kanban
+    assert normalized.ensure_default_columns() is normalized
+
+
+def test_card_positions_survive_in_place_replacement(session_state: dict[str, object]) -> None:
+    init_state()
+    todo = add_todo("Task", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    first = add_kanban_card(todo.id, title="Eins")
+    second = add_kanban_card(todo.id, title="Zwei")
+
+    assert first is not None and second is not None
+
+    move_kanban_card(todo.id, card_id=second.id, direction="right")
+    stored = next(item for item in get_todos() if item.id == todo.id)
+
+    assert stored.kanban.card_position(first.id) == 0
+    assert stored.kanban.card_position(second.id) == 1
+    assert stored.kanban.cards[1].column_id == DEFAULT_KANBAN_COLUMNS[1].id
+    assert stored.kanban.card_position("missing") is None
+
+
+def test_cards_by_created_sorts_only_out_of_order_cards() -> None:
+    first = KanbanCard(title="Eins", column_id="backlog", created_at=datetime(2024, 1, 1))
+    second = KanbanCard(title="Zwei", column_id="backlog", created_at=datetime(2024, 1, 2))
+
+    ordered = TodoKanban(cards=[first, second])
+    assert ordered.cards_by_created() is ordered.cards
+
+    shuffled = TodoKanban(cards=[second, first])
+    assert [card.title for card in shuffled.cards_by_created()] == ["Eins", "Zwei"]
+    assert [card.title for card in shuffled.cards] == ["Zwei", "Eins"]
+
+
+def test_set_kanban_card_column_jumps_to_target(session_state: dict[str, object]) -> None:
+    init_state()
+    todo = add_todo("Task", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    card = add_kanban_card(todo.id, title="Subtask")
+
+    assert card is not None
+    assert set_kanban_card_column(todo.id, card_id=card.id, column_id="missing") is None
+
+    moved = set_kanban_card_column(todo.id, card_id=card.id, column_id=DEFAULT_KANBAN_COLUMNS[2].id)
+    assert moved is not None
+    assert isinstance(moved.done_at, datetime)
+
+    reopened = set_kanban_card_column(todo.id, card_id=card.id, column_id=DEFAULT_KANBAN_COLUMNS[0].id)
+    assert reopened is not None
+    assert reopened.done_at is None
@@ -0,0 +1,38 @@
+from gerris_erfolgs_tracker.constants import SS_GAMIFICATION
+from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
+from gerris_erfolgs_tracker.models import GamificationState, MilestoneComplexity, MilestoneStatus
+from gerris_erfolgs_tracker.state import get_todos, init_state
+from gerris_erfolgs_tracker.todos import add_milestone, add_todo, set_milestone_status, update_milestone
+
+
+def test_set_milestone_status_moves_without_awarding_points(session_state: dict[str, object]) -> None:
+    init_state()
+    todo = add_todo("Task", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    milestone = add_milestone(todo.id, title="Schritt", complexity=MilestoneComplexity.SMALL, points=5)
+
+    assert milestone is not None
+    unchanged = set_milestone_status(todo.id, milestone.id, MilestoneStatus.BACKLOG)
+    assert unchanged is not None
+    assert unchanged.status is MilestoneStatus.BACKLOG
+    assert set_milestone_status(todo.id, "missing", MilestoneStatus.DONE) is None
+
+    moved = set_milestone_status(todo.id, milestone.id, MilestoneStatus.DONE)
+    assert moved is not None
+    assert moved.status is MilestoneStatus.DONE
+
+    stored = next(item for item in get_todos() if item.id == todo.id)
+    assert stored.milestones[0].status is MilestoneStatus.DONE
+    assert GamificationState.model_validate(session_state[SS_GAMIFICATION]).points == 0
+
+
+def test_update_milestone_ignores_unknown_ids(session_state: dict[str, object]) -> None:
+    init_state()
+    todo = add_todo("Task", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    milestone = add_milestone(todo.id, title="Schritt", complexity=MilestoneComplexity.SMALL, points=5)
+
+    assert milestone is not None
+    assert update_milestone(todo.id, "missing", title="Neu") is None
+
+    renamed = update_milestone(todo.id, milestone.id, title="Neu")
+    assert renamed is not None
+    assert renamed.title == "Neu"
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from gerris_erfolgs_tracker.constants import SS_TODOS
+import pytest
+from pydantic import ValidationError
+
+from gerris_erfolgs_tracker.constants import SS_TODOS, append_capped
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
-from gerris_erfolgs_tracker.models import Category, EmailReminderOffset, RecurrencePattern, TodoItem
+from gerris_erfolgs_tracker.models import Category, EmailReminderOffset, Milestone, RecurrencePattern, TodoItem
 from gerris_erfolgs_tracker.state import get_todos, init_state
 
 
@@ -57,3 +60,28 @@ def test_legacy_todo_migration(session_state: dict[str, object]) -> None:
     assert stored["email_reminder"] == EmailReminderOffset.NONE
     assert stored["reminder_at"] is None
     assert stored["reminder_sent_at"] is None
+
+
+def test_milestones_are_immutable() -> None:
+    milestone = Milestone(title="Schritt")
+
+    with pytest.raises(ValidationError):
+        milestone.title = "Anders"  # type: ignore[misc]
+
+    assert milestone.model_copy(update={"title": "Anders"}).title == "Anders"
+
+
+def test_processed_progress_events_follow_in_place_appends_at_the_cap() -> None:
+    todo = TodoItem(
+        title="Events",
+        quadrant=EisenhowerQuadrant.URGENT_IMPORTANT,
+        processed_progress_events=["evt-1", "evt-2"],
+    )
+
+    assert todo.has_processed_progress_event("evt-1")
+    assert not todo.has_processed_progress_event("evt-3")
+
+    append_capped(todo.processed_progress_events, "evt-3", limit=2)
+
+    assert todo.has_processed_progress_event("evt-3")
+    assert not todo.has_processed_progress_event("evt-1")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from gerris_erfolgs_tracker.coach.plan_cache import PlanCache, plan_cache_key
+from gerris_erfolgs_tracker.coach.task_analyzer_models import MilestonePlanItem, TaskAIProposal
+from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
+
+
+def _proposal(start: date, due: date, *titles: str) -> TaskAIProposal:
+    return TaskAIProposal(
+        complexity_score=4,
+        estimated_minutes=120,
+        suggested_quadrant=EisenhowerQuadrant.NOT_URGENT_IMPORTANT,
+        suggested_priority=2,
+        milestone_plan=[
+            MilestonePlanItem(title=title, suggested_due=start + timedelta(days=index + 1))
+            for index, title in enumerate(titles)
+        ],
+        start_date=start,
+        due_date=due,
+    )
+
+
+def test_plan_cache_key_masks_numbers_and_case() -> None:
+    assert plan_cache_key("Q3-Review  vorbereiten") == plan_cache_key("q4-review vorbereiten")
+    assert plan_cache_key("Q3-Review", "Team A") != plan_cache_key("Q3-Review", "Team B")
+
+
+def test_plan_cache_adapts_numbers_and_dates() -> None:
+    cache = PlanCache()
+    start = date(2025, 6, 2)
+    cache.store("Q3-Review", "", _proposal(start, start + timedelta(days=10), "Zahlen Q3 sammeln", "Folien Q3"))
+
+    later = date(2025, 9, 1)
+    adapted = cache.adapt("Q4-Review", "", start_date=later, due_date=later + timedelta(days=10))
+
+    assert adapted is not None
+    assert [item.title for item in adapted.milestone_plan] == ["Zahlen Q4 sammeln", "Folien Q4"]
+    assert [item.suggested_due for item in adapted.milestone_plan] == [
+        later + timedelta(days=1),
+        later + timedelta(days=2),
+    ]
+    assert adapted.estimated_minutes == 120
+    assert cache.adapt("Steuererklärung", "", start_date=later, due_date=None) is None
+
+
+def test_plan_cache_misses_when_plan_outgrows_due_date() -> None:
+    cache = PlanCache()
+    start = date(2025, 6, 2)
+    cache.store("Umzug", "", _proposal(start, start + timedelta(days=10), "Kartons", "Transporter"))
+
+    assert cache.adapt("Umzug", "", start_date=start, due_date=start + timedelta(days=1)) is None
+
+
+def test_plan_cache_evicts_least_used_template() -> None:
+    cache = PlanCache(capacity=2)
+    start = date(2025, 6, 2)
+    due = start + timedelta(days=10)
+    cache.store("Alpha", "", _proposal(start, due, "A"))
+    cache.store("Beta", "", _proposal(start, due, "B"))
+    assert cache.adapt("Alpha", "", start_date=start, due_date=due) is not None
+
+    cache.store("Gamma", "", _proposal(start, due, "C"))
+
+    assert len(cache) == 2
+    assert cache.adapt("Beta", "", start_date=start, due_date=due) is None
+    assert cache.adapt("Alpha", "", start_date=start, due_date=due) is not None
@@ -3,7 +3,8 @@ from __future__ import annotations
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
 from gerris_erfolgs_tracker.gamification import get_gamification_state
 from gerris_erfolgs_tracker.kpis import get_kpi_stats
-from gerris_erfolgs_tracker.state import init_state
+from gerris_erfolgs_tracker.models import TodoItem
+from gerris_erfolgs_tracker.state import get_todos, init_state, save_todos
 from gerris_erfolgs_tracker.todos import add_todo, update_todo_progress
 
 
@@ -57,3 +58,27 @@ def test_reapplying_same_event_id_is_ignored(session_state: dict[str, object]) -
     assert second_update.progress_current == first_update.progress_current
     assert get_kpi_stats().done_total == stats_after_first.done_total
     assert len(get_gamification_state().processed_completions) == len(gamification_after_first.processed_completions)
+
+
+def test_zero_progress_delta_records_event_and_auto_completes(session_state: dict[str, object]) -> None:
+    init_state()
+
+    todo = add_todo(title="Stretch", quadrant=EisenhowerQuadrant.NOT_URGENT_IMPORTANT, progress_target=2.0)
+    unchanged = update_todo_progress(todo, delta=0.0, source_event_id="evt-zero")
+    assert unchanged is not None
+    assert unchanged.progress_current == 0.0
+    assert unchanged.processed_progress_events == ["evt-zero"]
+    assert not unchanged.completed
+
+    reached = TodoItem(
+        title="Erreicht",
+        quadrant=EisenhowerQuadrant.NOT_URGENT_IMPORTANT,
+        progress_target=2.0,
+        progress_current=2.0,
+        auto_done_when_target_reached=True,
+    )
+    save_todos([*get_todos(), reached])
+
+    completed = update_todo_progress(reached, delta=0.0, source_event_id="evt-reached")
+    assert completed is not None
+    assert completed.completed
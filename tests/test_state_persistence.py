@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Iterator, Mapping, cast
+
+import pytest
+
+from gerris_erfolgs_tracker.constants import SS_COACH, SS_JOURNAL, SS_SETTINGS
+from gerris_erfolgs_tracker.journal import get_journal_entries
+from gerris_erfolgs_tracker.state import init_state
+from gerris_erfolgs_tracker.state_persistence import (
+    batch_saves,
+    configure_storage,
+    load_persisted_state,
+    persist_state,
+)
+
+
+class _MemoryBackend:
+    def __init__(self, state: Mapping[str, object]) -> None:
+        self.state: Mapping[str, object] = state
+        self.saved: list[Mapping[str, object]] = []
+
+    def load_state(self) -> Mapping[str, object]:
+        return self.state
+
+    def save_state(self, state: Mapping[str, object]) -> None:
+        self.saved.append(dict(state))
+
+
+@pytest.fixture()
+def memory_backend(session_state: dict[str, object]) -> Iterator[_MemoryBackend]:
+    backend = _MemoryBackend(
+        {
+            SS_SETTINGS: {"goal_profile": {}},
+            SS_JOURNAL: {"2024-07-31": {"date": "2024-07-31", "moods": ["ruhig"]}},
+            SS_COACH: {"seen_event_ids": ["coach:demo"]},
+        }
+    )
+    configure_storage(backend)
+    yield backend
+    configure_storage(None)
+
+
+def test_journal_and_coach_are_loaded_with_the_rest(
+    session_state: dict[str, object], memory_backend: _MemoryBackend
+) -> None:
+    load_persisted_state()
+    init_state()
+
+    assert session_state[SS_JOURNAL] == memory_backend.state[SS_JOURNAL]
+    assert cast(dict[str, object], session_state[SS_COACH])["seen_event_ids"] == ["coach:demo"]
+    assert [entry.moods for entry in get_journal_entries().values()] == [["ruhig"]]
+
+
+def test_persist_state_writes_loaded_values(session_state: dict[str, object], memory_backend: _MemoryBackend) -> None:
+    load_persisted_state()
+    session_state[SS_SETTINGS] = {"goal_profile": {"title": "Neu"}}
+
+    persist_state()
+
+    saved = memory_backend.saved[-1]
+    assert saved[SS_SETTINGS] == {"goal_profile": {"title": "Neu"}}
+    assert saved[SS_COACH] == {"seen_event_ids": ["coach:demo"]}
+
+
+def test_batch_saves_coalesces_writes(session_state: dict[str, object], memory_backend: _MemoryBackend) -> None:
+    load_persisted_state()
+
+    with batch_saves():
+        session_state[SS_SETTINGS] = {"goal_profile": {"title": "Eins"}}
+        persist_state()
+        with batch_saves():
+            session_state[SS_SETTINGS] = {"goal_profile": {"title": "Zwei"}}
+            persist_state()
+        assert memory_backend.saved == []
+
+    assert len(memory_backend.saved) == 1
+    assert memory_backend.saved[0][SS_SETTINGS] == {"goal_profile": {"title": "Zwei"}}
+
+
+def test_each_session_saves_through_its_own_backend(
+    session_state: dict[str, object], memory_backend: _MemoryBackend
+) -> None:
+    first_session = dict(session_state)
+    other_backend = _MemoryBackend({})
+    session_state.clear()
+    configure_storage(other_backend)
+    session_state[SS_SETTINGS] = {"goal_profile": {"title": "Andere"}}
+
+    persist_state()
+    session_state.clear()
+    session_state.update(first_session)
+    session_state[SS_SETTINGS] = {"goal_profile": {"title": "Erste"}}
+    persist_state()
+
+    assert [saved[SS_SETTINGS] for saved in other_backend.saved] == [{"goal_profile": {"title": "Andere"}}]
+    assert [saved[SS_SETTINGS] for saved in memory_backend.saved] == [{"goal_profile": {"title": "Erste"}}]
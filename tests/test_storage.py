@@ -90,3 +90,96 @@ def test_store_attachments_creates_references(tmp_path, monkeypatch) -> None:
     assert reference.relative_path == str(Path(ATTACHMENTS_FOLDER_NAME) / "todo-abc" / "note.png")
     assert resolved.exists()
     assert resolved.read_bytes() == b"img-bytes"
+
+
+def test_file_storage_appends_changed_todos_to_log(tmp_path) -> None:
+    backend = FileStorageBackend(tmp_path / "state.json")
+    first = {"id": "a", "title": "Erste"}
+    second = {"id": "b", "title": "Zweite"}
+    backend.save_state({"todos": [first, second], "settings": {"ai_enabled": False}})
+
+    backend.save_state({"todos": [{**first, "title": "Geändert"}, second], "settings": {"ai_enabled": False}})
+    backend.save_state({"todos": [second, {"id": "c", "title": "Dritte"}], "settings": {"ai_enabled": True}})
+
+    header, *log_lines = backend.log_path.read_text(encoding="utf-8").splitlines()
+    assert '"op":"snapshot"' in header
+    assert len(log_lines) == 4
+    assert '"Zweite"' not in backend.log_path.read_text(encoding="utf-8")
+
+    reloaded = FileStorageBackend(tmp_path / "state.json").load_state()
+    assert reloaded == {
+        "todos": [second, {"id": "c", "title": "Dritte"}],
+        "settings": {"ai_enabled": True},
+    }
+
+
+def test_file_storage_compacts_log_into_snapshot(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("gerris_erfolgs_tracker.storage.MUTATION_LOG_COMPACT_THRESHOLD", 2)
+    backend = FileStorageBackend(tmp_path / "state.json")
+    for index in range(3):
+        backend.save_state({"todos": [{"id": "a", "title": f"Version {index}"}]})
+
+    assert backend.log_path.exists()
+    assert FileStorageBackend(tmp_path / "state.json").load_state() == {"todos": [{"id": "a", "title": "Version 2"}]}
+
+    backend.save_state({"todos": [{"id": "a", "title": "Version 3"}]})
+    assert not backend.log_path.exists()
+    assert FileStorageBackend(tmp_path / "state.json").load_state() == {"todos": [{"id": "a", "title": "Version 3"}]}
+
+
+def test_file_storage_ignores_log_of_an_older_snapshot(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("gerris_erfolgs_tracker.storage.MUTATION_LOG_COMPACT_THRESHOLD", 1)
+    backend = FileStorageBackend(tmp_path / "state.json")
+    backend.save_state({"todos": [{"id": "a", "title": "Alt"}]})
+    backend.save_state({"todos": [{"id": "a", "title": "Mitte"}]})
+    stale_log = backend.log_path.read_bytes()
+
+    # Compaction swapped in the new snapshot but died before removing the log.
+    backend.save_state({"todos": [{"id": "a", "title": "Neu"}]})
+    backend.log_path.write_bytes(stale_log)
+
+    reloaded = FileStorageBackend(tmp_path / "state.json")
+    assert reloaded.load_state() == {"todos": [{"id": "a", "title": "Neu"}]}
+
+    reloaded.save_state({"todos": [{"id": "a", "title": "Neuer"}]})
+    assert b"Mitte" not in reloaded.log_path.read_bytes()
+    assert FileStorageBackend(tmp_path / "state.json").load_state() == {"todos": [{"id": "a", "title": "Neuer"}]}
+
+
+def test_file_storage_skips_torn_log_line(tmp_path) -> None:
+    backend = FileStorageBackend(tmp_path / "state.json")
+    backend.save_state({"todos": [{"id": "a", "title": "Grüße"}]})
+    backend.save_state({"todos": [{"id": "a", "title": "Grüße 2"}]})
+    with backend.log_path.open("ab") as file_handle:
+        file_handle.write(b'{"op": "upsert", "key": "todos", "id": "a", "val')
+
+    reloaded = FileStorageBackend(tmp_path / "state.json")
+    assert reloaded.load_state() == {"todos": [{"id": "a", "title": "Grüße 2"}]}
+
+    reloaded.save_state({"todos": [{"id": "a", "title": "Grüße 3"}]})
+    assert FileStorageBackend(tmp_path / "state.json").load_state() == {"todos": [{"id": "a", "title": "Grüße 3"}]}
+
+
+def test_file_storage_snapshot_replaces_file_without_leftovers(tmp_path) -> None:
+    backend = FileStorageBackend(tmp_path / "state.json")
+    backend.save_state({"settings": {"ai_enabled": False}})
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["state.json"]
+    assert FileStorageBackend(tmp_path / "state.json").load_state() == {"settings": {"ai_enabled": False}}
+
+
+def test_file_storage_drops_log_without_snapshot(tmp_path) -> None:
+    backend = FileStorageBackend(tmp_path / "state.json")
+    backend.load_state()
+    backend.save_state({"todos": [{"id": "a", "title": "Alt"}]})
+    backend.save_state({"todos": [{"id": "a", "title": "Neu"}]})
+    assert backend.log_path.exists()
+
+    backend.path.unlink()
+    fresh = FileStorageBackend(tmp_path / "state.json")
+
+    assert fresh.load_state() == {}
+    assert not backend.log_path.exists()
+    fresh.save_state({"todos": []})
+    assert fresh.path.exists()
+    assert not fresh.log_path.exists()
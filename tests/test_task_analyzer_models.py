@@ -1,9 +1,12 @@
 from datetime import date, timedelta
+from typing import Any, cast
 
 import pytest
+from openai import OpenAI
 
 from gerris_erfolgs_tracker.coach.task_analyzer_models import MilestonePlanItem, TaskAIProposal
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
+from gerris_erfolgs_tracker.ui import tasks as tasks_ui
 
 
 def test_task_ai_proposal_validates_increasing_dates() -> None:
@@ -60,3 +63,37 @@ def test_task_ai_proposal_requires_increasing_dates() -> None:
             start_date=start,
             due_date=due,
         )
+
+
+def test_task_proposal_request_reuses_cached_answer(
+    session_state: dict[str, object], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def fake_request(**kwargs: Any) -> TaskAIProposal:
+        calls.append(kwargs["model"])
+        return TaskAIProposal(
+            complexity_score=2,
+            estimated_minutes=30,
+            suggested_quadrant=EisenhowerQuadrant.URGENT_IMPORTANT,
+            suggested_priority=2,
+            milestone_plan=[],
+        )
+
+    monkeypatch.setattr(tasks_ui, "request_structured_response", fake_request)
+    tasks_ui._llm_task_proposal.clear()
+    client = cast(OpenAI, object())
+    due = date.today() + timedelta(days=5)
+
+    for _ in range(2):
+        suggestion = tasks_ui._request_task_proposal(
+            title="Quartalsreview",
+            description="",
+            due_date=due,
+            quadrant=EisenhowerQuadrant.URGENT_IMPORTANT,
+            client=client,
+        )
+        assert suggestion.from_ai
+        assert suggestion.payload.due_date == due
+
+    assert len(calls) == 1
@@ -8,8 +8,8 @@ import streamlit as st
 from gerris_erfolgs_tracker.constants import SS_TODOS
 from gerris_erfolgs_tracker.eisenhower import EisenhowerQuadrant
 from gerris_erfolgs_tracker.models import GamificationState, KpiStats, TodoItem
-from gerris_erfolgs_tracker.state import _coerce_todo
-from gerris_erfolgs_tracker.todos import toggle_complete
+from gerris_erfolgs_tracker.state import _coerce_todo, find_todo_index, get_todos, save_todos
+from gerris_erfolgs_tracker.todos import delete_todo, duplicate_todo, frozen_now, toggle_complete, update_todo
 
 
 def test_coerce_todo_defaults_auto_done_for_zero_target(session_state: dict[str, object]) -> None:
@@ -80,3 +80,99 @@ def test_toggle_complete_uncomplete_skips_completion(
     assert updated is not None
     assert updated.completed is False
     assert calls == {"kpis": 0, "gamification": 0}
+
+
+def test_find_todo_index_tracks_deletions(session_state: dict[str, object]) -> None:
+    first = TodoItem(title="Erste", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    second = TodoItem(title="Zweite", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    st.session_state[SS_TODOS] = [first.model_dump(), second.model_dump()]
+
+    assert find_todo_index(second.id) == 1
+    assert delete_todo(first.id) is True
+    assert find_todo_index(first.id) is None
+    assert find_todo_index(second.id) == 0
+    assert get_todos()[0].id == second.id
+
+
+def test_frozen_now_shares_completion_timestamp(session_state: dict[str, object]) -> None:
+    first = TodoItem(title="Erste", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    second = TodoItem(title="Zweite", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    st.session_state[SS_TODOS] = [first.model_dump(), second.model_dump()]
+
+    with frozen_now() as moment:
+        completed_first = toggle_complete(first.id)
+        completed_second = toggle_complete(second.id)
+
+    assert completed_first is not None and completed_second is not None
+    assert completed_first.completed_at == moment
+    assert completed_second.completed_at == moment
+
+
+def test_update_todo_skips_unchanged_fields(monkeypatch: pytest.MonkeyPatch, session_state: dict[str, object]) -> None:
+    todo = TodoItem(title="Gleich", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT, priority=2)
+    st.session_state[SS_TODOS] = [todo.model_dump()]
+
+    def fail_commit(*args: object, **kwargs: object) -> TodoItem:
+        raise AssertionError("unchanged todo must not be saved")
+
+    monkeypatch.setattr("gerris_erfolgs_tracker.todos._commit_todo_at_index", fail_commit)
+
+    result = update_todo(todo.id, title="Gleich", priority=2)
+
+    assert result is not None
+    assert result.id == todo.id
+
+
+def test_update_todo_without_changes_still_auto_completes(session_state: dict[str, object]) -> None:
+    todo = TodoItem(
+        title="Ziel erreicht",
+        quadrant=EisenhowerQuadrant.URGENT_IMPORTANT,
+        progress_target=3.0,
+        progress_current=3.0,
+        auto_done_when_target_reached=True,
+    )
+    st.session_state[SS_TODOS] = [todo.model_dump()]
+
+    result = update_todo(todo.id, title="Ziel erreicht")
+
+    assert result is not None
+    assert result.completed
+    assert result.completed_at is not None
+    assert get_todos()[0].completed
+
+
+def test_get_todos_reuses_models_until_list_is_replaced(session_state: dict[str, object]) -> None:
+    todo = TodoItem(title="Cache", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    st.session_state[SS_TODOS] = [todo.model_dump()]
+
+    first = get_todos()
+    second = get_todos()
+    assert first is not second
+    assert first[0] is second[0]
+
+    st.session_state[SS_TODOS] = [todo.model_copy(update={"title": "Neu"}).model_dump()]
+    assert get_todos()[0].title == "Neu"
+
+
+def test_save_todos_persists_in_place_edits(session_state: dict[str, object]) -> None:
+    todo = TodoItem(title="Alt", quadrant=EisenhowerQuadrant.URGENT_IMPORTANT)
+    st.session_state[SS_TODOS] = [todo.model_dump()]
+    todos = get_todos()
+
+    todos[0].title = "Neu"
+    save_todos(todos)
+
+    assert st.session_state[SS_TODOS][0]["title"] == "Neu"
+
+
+def test_duplicate_todo_appends_copy_with_new_id(session_state: dict[str, object]) -> None:
+    todo = TodoItem(title="Vorlage", quadrant=EisenhowerQuadrant.NOT_URGENT_IMPORTANT, priority=4, completed=True)
+    st.session_state[SS_TODOS] = [todo.model_dump()]
+
+    duplicate = duplicate_todo(todo.id)
+
+    assert duplicate is not None
+    assert duplicate.id != todo.id
+    assert (duplicate.title, duplicate.priority, duplicate.completed) == ("Vorlage", 4, False)
+    assert [item.id for item in get_todos()] == [todo.id, duplicate.id]
+    assert find_todo_index(duplicate.id) == 1